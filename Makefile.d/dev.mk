@@ -28,7 +28,7 @@ test-verbose: ## Run tests with verbose output
 	$(PYTHON) -m pytest -vv -s
 
 test-parallel: ## Run tests in parallel (requires pytest-xdist)
-	$(PYTHON) -m pytest -n auto
+	$(PYTHON) -m pytest -n auto --dist loadgroup
 
 lint: lint-code lint-types lint-security ## Run all linting checks
 
@@ -7,26 +7,28 @@ dependency resolution, and atomic rollback capability.
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Callable, Sequence
+from typing import Callable, Mapping, Sequence
 
 from .common import vlog
-from .config import Config
-from .environment import Environment
+from .config import Config, load_config
+from .environment import Environment, detect_environment
 from .installer import InstallResult, install_tool
 from .package_managers import select_package_manager
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
     """
     Specification for a tool to be installed.
@@ -55,25 +57,57 @@ class ToolSpec:
         }
 
 
-@dataclass
+# Statuses always present in ProgressTracker.get_summary()
+_PROGRESS_STATUSES = ("pending", "in_progress", "success", "failed", "skipped")
+
+
+@dataclass(slots=True)
 class ProgressTracker:
     """
     Thread-safe progress tracking for bulk operations.
 
+    Progress entries are immutable (status, message, timestamp) tuples and
+    per-status counts are kept up to date on every update, so readers never
+    walk the whole map and callbacks run without holding the lock. Writers
+    publish a new progress map rather than mutating the current one, so
+    progress readers take no lock at all.
+
+    Batch callbacks receive coalesced lists of (tool_name, status, message)
+    events, delivered once callback_batch_size events are pending or
+    callback_min_interval_s has passed since the last delivery, and on flush().
+
     Attributes:
-        _lock: Threading lock for thread-safe updates
-        _progress: Progress state for each tool
+        callback_min_interval_s: Maximum delay before pending batch events are delivered
+        callback_batch_size: Number of pending events that triggers a batch delivery
+        _lock: Threading lock guarding entry replacement and status counts
+        _progress: Published progress map, tool -> (status, message, timestamp);
+            replaced on every update and never mutated in place
+        _counts: Number of tools currently in each status
         _callbacks: Callbacks to invoke on progress updates
+        _batch_callbacks: Callbacks to invoke with batches of progress updates
+        _pending_events: Events not yet delivered to batch callbacks
+        _last_flush: time.monotonic() of the last batch delivery
     """
+    callback_min_interval_s: float = 0.1
+    callback_batch_size: int = 16
     _lock: threading.Lock = field(default_factory=threading.Lock)
-    _progress: dict[str, dict] = field(default_factory=dict)
+    _progress: dict[str, tuple[str, str, float]] = field(default_factory=dict)
+    _counts: Counter[str] = field(default_factory=Counter)
     _callbacks: list[Callable[[str, str, str], None]] = field(default_factory=list)
+    _batch_callbacks: list[Callable[[list[tuple[str, str, str]]], None]] = field(default_factory=list)
+    _pending_events: list[tuple[str, str, str]] = field(default_factory=list)
+    _last_flush: float = field(default_factory=time.monotonic)
 
     def register_callback(self, callback: Callable[[str, str, str], None]) -> None:
         """Register a callback for progress updates."""
         with self._lock:
             self._callbacks.append(callback)
 
+    def register_batch_callback(self, callback: Callable[[list[tuple[str, str, str]]], None]) -> None:
+        """Register a callback for coalesced batches of progress updates."""
+        with self._lock:
+            self._batch_callbacks.append(callback)
+
     def update(self, tool_name: str, status: str, message: str = "") -> None:
         """
         Update progress for a tool.
@@ -83,43 +117,73 @@ class ProgressTracker:
             status: Status ("pending", "in_progress", "success", "failed", "skipped")
             message: Optional status message
         """
+        entry = (status, message, time.time())
+        with self._lock:
+            previous = self._progress.get(tool_name)
+            self._progress = self._progress | {tool_name: entry}
+            if previous is not None:
+                self._counts[previous[0]] -= 1
+            self._counts[status] += 1
+            callbacks = tuple(self._callbacks)
+            batch = None
+            if self._batch_callbacks:
+                self._pending_events.append((tool_name, status, message))
+                if (len(self._pending_events) >= self.callback_batch_size
+                        or time.monotonic() - self._last_flush >= self.callback_min_interval_s):
+                    batch = self._take_pending()
+
+        # Invoke callbacks outside the lock so slow subscribers don't block other workers
+        for callback in callbacks:
+            callback(tool_name, status, message)
+        if batch:
+            self._dispatch_batch(batch)
+
+    def flush(self) -> None:
+        """Deliver any pending events to batch callbacks now."""
         with self._lock:
-            self._progress[tool_name] = {
-                "status": status,
-                "message": message,
-                "timestamp": time.time(),
-            }
-            # Invoke callbacks
-            for callback in self._callbacks:
-                callback(tool_name, status, message)
+            batch = self._take_pending()
+        if batch:
+            self._dispatch_batch(batch)
+
+    def _take_pending(self) -> list[tuple[str, str, str]]:
+        """Detach pending batch events; caller must hold _lock."""
+        batch = self._pending_events
+        self._pending_events = []
+        self._last_flush = time.monotonic()
+        return batch
+
+    def _dispatch_batch(self, batch: list[tuple[str, str, str]]) -> None:
+        """Invoke each batch callback once with batch."""
+        with self._lock:
+            callbacks = tuple(self._batch_callbacks)
+        for callback in callbacks:
+            callback(batch)
+
+    @staticmethod
+    def _as_dict(entry: tuple[str, str, float]) -> dict:
+        """Expand a stored progress tuple into its public dict form."""
+        status, message, timestamp = entry
+        return {"status": status, "message": message, "timestamp": timestamp}
 
     def get_progress(self, tool_name: str) -> dict | None:
         """Get progress for a specific tool."""
-        with self._lock:
-            return self._progress.get(tool_name)
+        entry = self._progress.get(tool_name)
+        return self._as_dict(entry) if entry is not None else None
 
     def get_all_progress(self) -> dict[str, dict]:
         """Get progress for all tools."""
-        with self._lock:
-            return self._progress.copy()
+        snapshot = self._progress  # Published maps are never mutated
+        return {name: self._as_dict(entry) for name, entry in snapshot.items()}
 
     def get_summary(self) -> dict[str, int]:
         """Get summary counts by status."""
+        summary = dict.fromkeys(_PROGRESS_STATUSES, 0)
         with self._lock:
-            summary = {
-                "pending": 0,
-                "in_progress": 0,
-                "success": 0,
-                "failed": 0,
-                "skipped": 0,
-            }
-            for progress in self._progress.values():
-                status = progress.get("status", "pending")
-                summary[status] = summary.get(status, 0) + 1
-            return summary
-
-
-@dataclass(frozen=True)
+            summary.update((status, count) for status, count in self._counts.items() if count)
+        return summary
+
+
+@dataclass(frozen=True, slots=True)
 class BulkInstallResult:
     """
     Complete result of bulk tool installation.
@@ -151,20 +215,118 @@ class BulkInstallResult:
         }
 
 
-def get_missing_tools(tool_names: Sequence[str], verbose: bool = False) -> list[str]:
+@functools.lru_cache(maxsize=64)
+def _list_path_dir(directory: str, mtime_ns: int) -> frozenset[str]:
+    """
+    List the regular files in one PATH directory.
+
+    Keyed by the directory's mtime so adding or removing an entry (e.g. a
+    fresh install) produces a new listing; repeated scans of an unchanged
+    PATH cost one stat per directory.
+
+    Args:
+        directory: PATH entry to list
+        mtime_ns: Directory modification time, part of the cache key only
+
+    Returns:
+        Names of regular files (or symlinks to them) in directory
+    """
+    names = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        names.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return frozenset(names)
+
+
+def _prescan_path(tool_names: Sequence[str]) -> dict[str, str]:
+    """
+    Locate executables for tool_names with one directory listing per PATH entry.
+
+    Mirrors shutil.which on POSIX: the first executable regular file in PATH
+    order wins. Costs one scandir per PATH entry instead of one stat per
+    (tool, PATH entry) pair, and listings of unchanged directories are reused
+    across calls.
+
+    Args:
+        tool_names: Names of tools to look up
+
+    Returns:
+        Dictionary mapping each tool name found on PATH to its binary path
+    """
+    wanted = set(tool_names)
+    found: dict[str, str] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not directory or len(found) == len(wanted):
+            continue
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue
+        # Executable bits can change without touching the directory, so check them here
+        for name in wanted.intersection(_list_path_dir(directory, mtime_ns)).difference(found):
+            path = os.path.join(directory, name)
+            if os.access(path, os.X_OK):
+                found[name] = path
+    return found
+
+
+# Languages whose installs compile locally (cargo install, go install)
+_CPU_BOUND_LANGUAGES = frozenset({"rust", "go"})
+
+
+def _default_workers(specs: Sequence[ToolSpec]) -> int:
+    """
+    Pick a default worker count for installing specs on this host.
+
+    Most installs wait on downloads, so they get several workers per CPU;
+    local source builds compete for CPU, so they get one worker per CPU
+    minus one.
+
+    Args:
+        specs: Tool specifications to be installed
+
+    Returns:
+        Number of parallel workers
+    """
+    cpus = os.cpu_count() or 1
+    if any(spec.language in _CPU_BOUND_LANGUAGES for spec in specs):
+        return max(1, cpus - 1)
+    return min(32, cpus * 4)
+
+
+def get_missing_tools(
+    tool_names: Sequence[str],
+    verbose: bool = False,
+    path_index: Mapping[str, str | None] | None = None,
+) -> list[str]:
     """
     Identify tools that are not currently installed.
 
     Args:
         tool_names: Names of tools to check
         verbose: Enable verbose logging
+        path_index: Optional result of _prescan_path(); scanned here when omitted
 
     Returns:
         List of tool names that are not installed
     """
+    if path_index is None:
+        if sys.platform != "win32":
+            path_index = _prescan_path(tool_names)
+        else:
+            # Windows lookups need PATHEXT handling, so leave those to shutil.which
+            path_index = {tool_name: shutil.which(tool_name) for tool_name in dict.fromkeys(tool_names)}
+
     missing = []
     for tool_name in tool_names:
-        binary_path = shutil.which(tool_name)
+        binary_path = path_index.get(tool_name)
         if not binary_path:
             missing.append(tool_name)
             vlog(f"Tool not found: {tool_name}", verbose)
@@ -186,10 +348,19 @@ def resolve_dependencies(specs: Sequence[ToolSpec], verbose: bool = False) -> li
     Returns:
         List of lists, where each inner list contains tools that can be installed in parallel
     """
+    # ToolSpec is frozen, so the spec tuple itself is the memo key; the caller
+    # gets fresh lists so the cached levels can't be mutated
+    return [list(level) for level in _resolve_levels(tuple(specs), verbose)]
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_levels(specs: tuple[ToolSpec, ...], verbose: bool) -> tuple[tuple[ToolSpec, ...], ...]:
+    """Memoized level computation behind resolve_dependencies()."""
     # Build dependency graph
     spec_map = {spec.tool_name: spec for spec in specs}
-    in_degree = {spec.tool_name: 0 for spec in specs}
-    adjacency: dict[str, list[str]] = {spec.tool_name: [] for spec in specs}
+    position = {name: index for index, name in enumerate(spec_map)}
+    in_degree = dict.fromkeys(spec_map, 0)
+    adjacency: dict[str, list[str]] = {name: [] for name in spec_map}
 
     for spec in specs:
         for dep in spec.dependencies:
@@ -197,32 +368,35 @@ def resolve_dependencies(specs: Sequence[ToolSpec], verbose: bool = False) -> li
                 adjacency[dep].append(spec.tool_name)
                 in_degree[spec.tool_name] += 1
 
-    # Topological sort by levels
-    levels: list[list[ToolSpec]] = []
-    # Use list to preserve original order (sets don't maintain insertion order)
-    remaining = list(spec_map.keys())
-
-    while remaining:
-        # Find tools with no unmet dependencies (preserving original order)
-        ready = [tool for tool in remaining if in_degree[tool] == 0]
-        if not ready:
-            # Circular dependency detected
-            vlog(f"Circular dependency detected for tools: {remaining}", verbose)
-            # Add remaining tools to final level (will likely fail)
-            levels.append([spec_map[tool] for tool in remaining])
-            break
-
-        # Add this level
-        levels.append([spec_map[tool] for tool in ready])
+    # Kahn's algorithm in waves: each wave is the set of tools whose last
+    # dependency was in the previous wave, so every edge is visited once
+    levels: list[tuple[ToolSpec, ...]] = []
+    ready = [name for name in spec_map if in_degree[name] == 0]
+    emitted = 0
+
+    while ready:
+        levels.append(tuple(spec_map[tool] for tool in ready))
         vlog(f"Installation level {len(levels)}: {ready}", verbose)
+        emitted += len(ready)
 
-        # Remove ready tools and update in-degrees
+        next_ready = []
         for tool in ready:
-            remaining.remove(tool)
             for neighbor in adjacency[tool]:
                 in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    next_ready.append(neighbor)
+        # Keep the original spec order within a level
+        next_ready.sort(key=position.__getitem__)
+        ready = next_ready
+
+    if emitted < len(spec_map):
+        # Circular dependency detected
+        remaining = [name for name in spec_map if in_degree[name] > 0]
+        vlog(f"Circular dependency detected for tools: {remaining}", verbose)
+        # Add remaining tools to final level (will likely fail)
+        levels.append(tuple(spec_map[tool] for tool in remaining))
 
-    return levels
+    return tuple(levels)
 
 
 def get_tools_to_install(
@@ -322,16 +496,30 @@ def group_by_package_manager(
     Returns:
         Dictionary mapping package manager names to tool specs
     """
-    groups: dict[str, list[ToolSpec]] = {}
-
-    for spec in specs:
+    def select(key: tuple[str, str | None]) -> str:
+        tool_name, language = key
         pm_name, _ = select_package_manager(
-            tool_name=spec.tool_name,
-            language=spec.language,
+            tool_name=tool_name,
+            language=language,
             config=config,
             env=env,
             verbose=verbose,
         )
+        return pm_name
+
+    # Selection only depends on (tool_name, language), so each pair is selected
+    # once. It may probe package managers with subprocesses on a cold cache, so
+    # select concurrently; map() keeps results in key order
+    keys = list(dict.fromkeys((spec.tool_name, spec.language) for spec in specs))
+    if len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(keys))) as executor:
+            selected = dict(zip(keys, executor.map(select, keys)))
+    else:
+        selected = {key: select(key) for key in keys}
+
+    groups: dict[str, list[ToolSpec]] = {}
+    for spec in specs:
+        pm_name = selected[(spec.tool_name, spec.language)]
         if pm_name not in groups:
             groups[pm_name] = []
         groups[pm_name].append(spec)
@@ -340,6 +528,24 @@ def group_by_package_manager(
     return groups
 
 
+# Uninstall command per package manager (the inverse of its install_command_template),
+# formatted with tool and pm
+_ROLLBACK_COMMANDS = {
+    "apt": "sudo apt-get remove -y {tool}",
+    "apt-get": "sudo apt-get remove -y {tool}",
+    "dnf": "sudo dnf remove -y {tool}",
+    "pacman": "sudo pacman -R --noconfirm {tool}",
+    "brew": "brew uninstall {tool}",
+    "cargo": "cargo uninstall {tool}",
+    "pip": "pip uninstall -y {tool}",
+    "pipx": "pipx uninstall {tool}",
+    "uv": "uv tool uninstall {tool}",
+    "npm": "npm uninstall -g {tool}",
+    "yarn": "yarn global remove {tool}",
+    "pnpm": "pnpm remove -g {tool}",
+}
+
+
 def generate_rollback_script(results: Sequence[InstallResult], verbose: bool = False) -> str:
     """
     Generate a rollback script for successful installations.
@@ -351,42 +557,39 @@ def generate_rollback_script(results: Sequence[InstallResult], verbose: bool = F
     Returns:
         Path to generated rollback script
     """
+    lines = [
+        "#!/bin/bash",
+        "set -euo pipefail",
+        "",
+        "# Rollback script for bulk installation",
+        f"# Generated: {datetime.now().isoformat()}",
+        "",
+    ]
+    for result in results:
+        if result.success and result.binary_path:
+            pm = result.package_manager_used
+            # Generate uninstall command based on package manager
+            template = _ROLLBACK_COMMANDS.get(pm, "# Manual removal required for {tool} ({pm})")
+            lines.append(f"# Rollback: {result.tool_name}")
+            lines.append(template.format(tool=result.tool_name, pm=pm))
+            lines.append("")
+    lines.append("")
+
+    # Build the script once; mkstemp creates a fresh file (O_CREAT | O_EXCL), so
+    # runs in the same second never clobber each other or follow a planted symlink
+    payload = "\n".join(lines).encode("utf-8")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    script_path = os.path.join(tempfile.gettempdir(), f"rollback_{timestamp}.sh")
-
-    with open(script_path, "w") as f:
-        f.write("#!/bin/bash\n")
-        f.write("set -euo pipefail\n\n")
-        f.write("# Rollback script for bulk installation\n")
-        f.write(f"# Generated: {datetime.now().isoformat()}\n\n")
-
-        for result in results:
-            if result.success and result.binary_path:
-                f.write(f"# Rollback: {result.tool_name}\n")
-                pm = result.package_manager_used
-
-                # Generate uninstall command based on package manager
-                if pm in ("apt", "apt-get"):
-                    f.write(f"sudo apt-get remove -y {result.tool_name}\n")
-                elif pm == "dnf":
-                    f.write(f"sudo dnf remove -y {result.tool_name}\n")
-                elif pm == "pacman":
-                    f.write(f"sudo pacman -R --noconfirm {result.tool_name}\n")
-                elif pm == "brew":
-                    f.write(f"brew uninstall {result.tool_name}\n")
-                elif pm == "cargo":
-                    f.write(f"cargo uninstall {result.tool_name}\n")
-                elif pm in ("pip", "pipx", "uv"):
-                    f.write(f"{pm} uninstall -y {result.tool_name}\n")
-                elif pm == "npm":
-                    f.write(f"npm uninstall -g {result.tool_name}\n")
-                else:
-                    f.write(f"# Manual removal required for {result.tool_name} ({pm})\n")
-
-                f.write("\n")
-
-    # Make script executable
-    Path(script_path).chmod(0o755)
+    # Bytes prefix/suffix keep mkstemp on the bytes temp dir, so the path is never re-encoded
+    fd, script_path_b = tempfile.mkstemp(prefix=f"rollback_{timestamp}_".encode(), suffix=b".sh")
+    script_path = os.fsdecode(script_path_b)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fchmod(fd, 0o755)  # mkstemp creates the file 0o600
+    finally:
+        os.close(fd)
+
     vlog(f"Generated rollback script: {script_path}", verbose)
     return script_path
 
@@ -404,6 +607,8 @@ def execute_rollback(script_path: str, verbose: bool = False) -> bool:
     """
     try:
         vlog(f"Executing rollback script: {script_path}", verbose)
+        # Absolute path and no cwd/preexec_fn/start_new_session keeps CPython on its
+        # vfork (or posix_spawn) path, so the child never copies this process's pages
         result = subprocess.run(
             [script_path],
             capture_output=True,
@@ -454,14 +659,10 @@ def bulk_install(
     Returns:
         BulkInstallResult with installation outcomes
     """
-    from .config import load_config
-    from .environment import detect_environment
-
-    # Load config and environment if not provided
+    # Load config if not provided; environment detection waits until
+    # something will actually be installed
     if config is None:
         config = load_config(verbose=verbose)
-    if env is None:
-        env = detect_environment(verbose=verbose)
 
     start_time = time.time()
 
@@ -491,6 +692,9 @@ def bulk_install(
             duration_seconds=time.time() - start_time,
         )
 
+    if env is None:
+        env = detect_environment(verbose=verbose)
+
     # Initialize progress tracker
     if progress_tracker is None:
         progress_tracker = ProgressTracker()
@@ -499,70 +703,88 @@ def bulk_install(
     for spec in specs:
         progress_tracker.update(spec.tool_name, "pending")
 
-    # Determine max workers
+    # Determine max workers; preferences.max_workers caps the host-derived default
     if max_workers is None:
-        import os
-        max_workers = min(16, os.cpu_count() or 4 + 4)
+        max_workers = min(config.preferences.max_workers, _default_workers(specs))
 
     # Execute installations level by level
     successes: list[InstallResult] = []
     failures: list[InstallResult] = []
     skipped: list[str] = []
 
-    for level_idx, level_specs in enumerate(levels):
-        vlog(f"Installing level {level_idx + 1}/{len(levels)}: {[s.tool_name for s in level_specs]}", verbose)
-
-        # Install this level in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_spec = {
-                executor.submit(
-                    _install_with_progress,
-                    spec,
-                    config,
-                    env,
-                    progress_tracker,
-                    verbose,
-                ): spec
-                for spec in level_specs
-            }
-
-            for future in as_completed(future_to_spec):
-                spec = future_to_spec[future]
-                try:
-                    result = future.result()
-                    if result.success:
-                        successes.append(result)
-                        progress_tracker.update(spec.tool_name, "success", f"v{result.installed_version}")
-                    else:
-                        failures.append(result)
-                        progress_tracker.update(spec.tool_name, "failed", result.error_message or "Unknown error")
-
-                        if fail_fast:
-                            vlog(f"Fail-fast: Stopping due to {spec.tool_name} failure", verbose)
-                            # Cancel remaining futures
-                            for f in future_to_spec:
-                                f.cancel()
-                            break
-
-                except Exception as e:
-                    vlog(f"Unexpected error installing {spec.tool_name}: {str(e)}", verbose)
-                    progress_tracker.update(spec.tool_name, "failed", str(e))
-
-        # Stop if fail-fast triggered
-        if fail_fast and failures:
-            # Mark remaining tools as skipped
-            for level in levels[level_idx + 1:]:
-                for spec in level:
-                    skipped.append(spec.tool_name)
-                    progress_tracker.update(spec.tool_name, "skipped", "Skipped due to fail-fast")
-            break
-
+    # One pool serves every level, so worker threads are reused rather than
+    # respawned for each dependency level
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for level_idx, level_specs in enumerate(levels):
+            vlog(f"Installing level {level_idx + 1}/{len(levels)}: {[s.tool_name for s in level_specs]}", verbose)
+
+            # Install this level in parallel. With fail_fast, keep at most
+            # max_workers tools in flight and submit the next one as each
+            # finishes, so the pool stays full but nothing new starts after a failure
+            window = max_workers if fail_fast else len(level_specs)
+            queued = deque(level_specs)
+            future_to_spec: dict[Future[InstallResult], ToolSpec] = {}
+            while queued or future_to_spec:
+                while queued and len(future_to_spec) < window and not (fail_fast and failures):
+                    spec = queued.popleft()
+                    future = executor.submit(
+                        _install_with_progress,
+                        spec,
+                        config,
+                        env,
+                        progress_tracker,
+                        verbose,
+                    )
+                    future_to_spec[future] = spec
+                if not future_to_spec:
+                    break
+
+                done, _ = wait(future_to_spec, return_when=FIRST_COMPLETED)
+                for future in done:
+                    spec = future_to_spec.pop(future)
+                    try:
+                        result = future.result()
+                        if result.success:
+                            successes.append(result)
+                            progress_tracker.update(spec.tool_name, "success", f"v{result.installed_version}")
+                        else:
+                            failures.append(result)
+                            progress_tracker.update(spec.tool_name, "failed", result.error_message or "Unknown error")
+
+                            if fail_fast:
+                                # Tools already running are still collected so their
+                                # installs can be rolled back
+                                vlog(f"Fail-fast: Stopping due to {spec.tool_name} failure", verbose)
+
+                    except Exception as e:
+                        vlog(f"Unexpected error installing {spec.tool_name}: {str(e)}", verbose)
+                        progress_tracker.update(spec.tool_name, "failed", str(e))
+
+            # Tools in this level that were never submitted
+            for spec in queued:
+                skipped.append(spec.tool_name)
+                progress_tracker.update(spec.tool_name, "skipped", "Skipped due to fail-fast")
+
+            # Stop if fail-fast triggered
+            if fail_fast and failures:
+                # Mark remaining tools as skipped
+                for level in levels[level_idx + 1:]:
+                    for spec in level:
+                        skipped.append(spec.tool_name)
+                        progress_tracker.update(spec.tool_name, "skipped", "Skipped due to fail-fast")
+                break
+
+    progress_tracker.flush()
     duration = time.time() - start_time
 
-    # Generate rollback script
+    # Generate rollback script, only when some install left a binary to remove
+    # and the script is wanted (atomic mode always needs it)
     rollback_script = None
-    if successes:
-        rollback_script = generate_rollback_script(successes, verbose)
+    rollbackable = [result for result in successes if result.binary_path]
+    if rollbackable and (atomic or config.preferences.bulk.generate_rollback_script):
+        rollback_script = generate_rollback_script(rollbackable, verbose)
+    elif successes:
+        vlog("Skipping rollback script: nothing to roll back or disabled in preferences", verbose)
 
     # Handle atomic rollback
     if atomic and failures:
@@ -13,6 +13,8 @@ import json
 import logging
 import os
 import re
+import shutil
+import subprocess
 import time
 import urllib.request
 from typing import Any
@@ -421,9 +423,6 @@ def get_gh_cli_token() -> str | None:
     Returns:
         Token string or None if gh CLI is not available/authenticated
     """
-    import shutil
-    import subprocess
-
     if not shutil.which("gh"):
         return None
 
@@ -499,8 +498,6 @@ def get_github_rate_limit_help() -> str:
     Returns:
         Multiline string with instructions
     """
-    import shutil
-
     lines = []
 
     # Check if gh CLI is available
@@ -552,7 +549,6 @@ def get_gitlab_rate_limit(host: str = "gitlab.com") -> dict[str, Any]:
 
         # Try glab CLI if no token in environment
         if not token:
-            import subprocess
             try:
                 result = subprocess.run(
                     ["glab", "auth", "token", "--hostname", host],
@@ -5,9 +5,39 @@ Common utilities shared across cli_audit modules.
 from __future__ import annotations
 
 import os
+import struct
 import sys
 
 
+# Environment variables set by CI/CD systems (a non-empty value marks a CI run)
+CI_ENV_VARS = frozenset({
+    "CI",
+    "CONTINUOUS_INTEGRATION",
+    "GITHUB_ACTIONS",
+    "GITLAB_CI",
+    "CIRCLECI",
+    "TRAVIS",
+    "JENKINS_HOME",
+    "BUILDKITE",
+    "DRONE",
+    "SEMAPHORE",
+    "APPVEYOR",
+    "CODEBUILD_BUILD_ID",
+    "TF_BUILD",  # Azure Pipelines
+})
+
+
+def get_ci_env_vars() -> list[str]:
+    """
+    Get the CI/CD indicator variables set in the environment.
+
+    Returns:
+        Sorted names from CI_ENV_VARS that are set to a non-empty value.
+    """
+    env = os.environ
+    return sorted(var for var in CI_ENV_VARS.intersection(env) if env[var])
+
+
 def is_ci_environment() -> bool:
     """
     Check if running in a CI/CD environment.
@@ -15,31 +45,71 @@ def is_ci_environment() -> bool:
     Returns:
         True if CI indicators are present, False otherwise.
     """
-    ci_indicators = [
-        "CI",
-        "CONTINUOUS_INTEGRATION",
-        "GITHUB_ACTIONS",
-        "GITLAB_CI",
-        "CIRCLECI",
-        "TRAVIS",
-        "JENKINS_HOME",
-        "BUILDKITE",
-        "DRONE",
-        "SEMAPHORE",
-        "APPVEYOR",
-        "CODEBUILD_BUILD_ID",
-        "TF_BUILD",  # Azure Pipelines
-    ]
-    return any(os.environ.get(var) for var in ci_indicators)
+    return bool(get_ci_env_vars())
+
+
+# glibc utmp database, as read by 'who'; records are struct utmp (384 bytes on Linux)
+_UTMP_PATH = "/var/run/utmp"
+_UTMP_RECORD = struct.Struct("hxxi32s4s32s")  # ut_type, ut_pid, ut_line, ut_id, ut_user
+_UTMP_RECORD_SIZE = 384
+_USER_PROCESS = 7
+
+
+def _count_utmp_users(utmp_path: str = _UTMP_PATH) -> int | None:
+    """
+    Count distinct users with a login session, reading utmp like 'who' does.
+
+    Every USER_PROCESS record counts (root, terminal, ssh and graphical
+    sessions alike), except records whose process no longer exists, which
+    'who' skips as well.
+
+    Args:
+        utmp_path: utmp database to read
+
+    Returns:
+        Number of distinct login names, or None if the database is missing
+        or not in the Linux record layout.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open(utmp_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) % _UTMP_RECORD_SIZE:
+        return None
+
+    users = set()
+    for offset in range(0, len(data), _UTMP_RECORD_SIZE):
+        ut_type, pid, _line, _id, user = _UTMP_RECORD.unpack_from(data, offset)
+        if ut_type != _USER_PROCESS or not user.strip(b"\0"):
+            continue
+        if pid > 0:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                continue  # Stale record left by a session that was not logged out
+            except OSError:
+                pass  # Exists but owned by another user
+        users.add(user.rstrip(b"\0"))
+    return len(users)
 
 
 def get_active_user_count() -> int:
     """
     Get approximate count of active users on system.
 
+    On Linux, reads the utmp database directly (see _count_utmp_users);
+    elsewhere, or if utmp is unavailable, parses 'who'.
+
     Returns:
         Number of unique users with active sessions, or -1 if cannot determine.
     """
+    count = _count_utmp_users()
+    if count is not None:
+        return count
+
     try:
         # Try using 'who' command to count unique logged-in users
         import subprocess
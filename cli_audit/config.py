@@ -7,13 +7,27 @@ Merges configurations from multiple sources (project → user → system → def
 
 from __future__ import annotations
 
+import copy
 import json
 import os
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, TypeVar
 
 from .common import vlog
 
+try:
+    import orjson  # Optional C parser; its JSONDecodeError subclasses json.JSONDecodeError
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+try:
+    import yaml
+    _HAVE_YAML = True
+    # PyYAML built against libyaml provides CSafeLoader, a C parser for the same safe subset
+    _HAVE_LIBYAML = bool(getattr(yaml, "__with_libyaml__", False))
+except ImportError:
+    _HAVE_YAML = False
 
 # Configuration file locations (in priority order)
 CONFIG_LOCATIONS = [
@@ -25,8 +39,16 @@ CONFIG_LOCATIONS = [
     "/etc/cli-audit/config.yaml",
 ]
 
+# Parsed configs keyed by (path, st_mtime_ns, st_size); a changed file gets a new key
+_loaded_configs: dict[tuple[str, int, int], Config] = {}
+
+# Accepted values for validated string settings
+_VALID_RECONCILIATION = frozenset({"parallel", "aggressive"})
+_VALID_BREAKING_CHANGES = frozenset({"accept", "warn", "reject"})
+_VALID_ENVIRONMENT_MODES = frozenset({"auto", "ci", "server", "workstation"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ToolConfig:
     """
     Configuration for a specific tool.
@@ -53,7 +75,11 @@ class ToolConfig:
         )
 
 
-@dataclass(frozen=True)
+# Returned for unconfigured tools; frozen, so one instance serves every lookup
+_DEFAULT_TOOL_CONFIG = ToolConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class BulkPreferences:
     """
     Preferences for bulk installation operations.
@@ -77,7 +103,7 @@ class BulkPreferences:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Preferences:
     """
     User preferences for installation behavior.
@@ -104,14 +130,14 @@ class Preferences:
     def __post_init__(self):
         """Validate preferences after initialization."""
         # Validate reconciliation
-        if self.reconciliation not in {"parallel", "aggressive"}:
+        if self.reconciliation not in _VALID_RECONCILIATION:
             raise ValueError(
                 f"Invalid reconciliation strategy: {self.reconciliation}. "
                 "Must be 'parallel' or 'aggressive'"
             )
 
         # Validate breaking_changes
-        if self.breaking_changes not in {"accept", "warn", "reject"}:
+        if self.breaking_changes not in _VALID_BREAKING_CHANGES:
             raise ValueError(
                 f"Invalid breaking_changes setting: {self.breaking_changes}. "
                 "Must be 'accept', 'warn', or 'reject'"
@@ -157,7 +183,7 @@ class Preferences:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Complete configuration for CLI audit tool.
@@ -184,11 +210,10 @@ class Config:
             raise ValueError(f"Unsupported config version: {self.version}. Expected version 1")
 
         # Validate environment_mode
-        valid_modes = {"auto", "ci", "server", "workstation"}
-        if self.environment_mode not in valid_modes:
+        if self.environment_mode not in _VALID_ENVIRONMENT_MODES:
             raise ValueError(
                 f"Invalid environment_mode: {self.environment_mode}. "
-                f"Must be one of: {', '.join(sorted(valid_modes))}"
+                f"Must be one of: {', '.join(sorted(_VALID_ENVIRONMENT_MODES))}"
             )
 
     @staticmethod
@@ -235,7 +260,7 @@ class Config:
         Returns:
             ToolConfig for the tool, or default ToolConfig if not configured
         """
-        return self.tools.get(tool_name, ToolConfig())
+        return self.tools.get(tool_name, _DEFAULT_TOOL_CONFIG)
 
     def is_auto_update_enabled(self, tool_name: str) -> bool:
         """
@@ -265,54 +290,21 @@ class Config:
             New merged Config object
         """
         # Merge tools (this config takes priority)
-        merged_tools = dict(other.tools)
-        merged_tools.update(self.tools)
+        merged_tools = other.tools | self.tools
 
         # Merge package_managers preferences
-        merged_pkg_mgrs = dict(other.preferences.package_managers)
-        merged_pkg_mgrs.update(self.preferences.package_managers)
-
-        # Merge bulk preferences (prefer this config's values if non-default)
-        self_bulk = self.preferences.bulk
-        other_bulk = other.preferences.bulk
-        merged_bulk = BulkPreferences(
-            fail_fast=self_bulk.fail_fast if self_bulk.fail_fast else other_bulk.fail_fast,
-            auto_rollback=self_bulk.auto_rollback if self_bulk.auto_rollback else other_bulk.auto_rollback,
-            generate_rollback_script=self_bulk.generate_rollback_script,
-        )
+        merged_pkg_mgrs = other.preferences.package_managers | self.preferences.package_managers
 
-        # Create merged preferences (prefer this config's values)
-        self_prefs = self.preferences
-        other_prefs = other.preferences
-        merged_preferences = Preferences(
-            reconciliation=(
-                self_prefs.reconciliation
-                if self_prefs.reconciliation != "parallel"
-                else other_prefs.reconciliation
-            ),
-            breaking_changes=(
-                self_prefs.breaking_changes
-                if self_prefs.breaking_changes != "warn"
-                else other_prefs.breaking_changes
-            ),
-            auto_upgrade=self_prefs.auto_upgrade,
-            timeout_seconds=(
-                self_prefs.timeout_seconds
-                if self_prefs.timeout_seconds != 5
-                else other_prefs.timeout_seconds
-            ),
-            max_workers=(
-                self_prefs.max_workers
-                if self_prefs.max_workers != 16
-                else other_prefs.max_workers
-            ),
+        # Merge preferences field by field: this config's value wins unless it
+        # is still the default, in which case the other config's value is used
+        merged_preferences = replace(
+            _prefer_non_default(self.preferences, other.preferences),
             package_managers=merged_pkg_mgrs,
-            bulk=merged_bulk,
+            bulk=_prefer_non_default(self.preferences.bulk, other.preferences.bulk),
         )
 
         # Merge presets (this config takes priority)
-        merged_presets = dict(other.presets)
-        merged_presets.update(self.presets)
+        merged_presets = other.presets | self.presets
 
         # Prefer this config's environment mode if not auto
         merged_env_mode = self.environment_mode if self.environment_mode != "auto" else other.environment_mode
@@ -327,6 +319,33 @@ class Config:
         )
 
 
+_Prefs = TypeVar("_Prefs", Preferences, BulkPreferences)
+
+# Default instances that merging compares field values against. Never handed
+# out: Preferences holds a mutable package_managers dict, so each Config gets its own.
+_DEFAULT_PREFERENCES: dict[type, Any] = {Preferences: Preferences(), BulkPreferences: BulkPreferences()}
+
+
+def _prefer_non_default(preferred: _Prefs, fallback: _Prefs) -> _Prefs:
+    """
+    Merge two preference objects, keeping preferred's non-default values.
+
+    Args:
+        preferred: Higher priority preferences
+        fallback: Lower priority preferences
+
+    Returns:
+        preferred with every field still at its default taken from fallback
+    """
+    defaults = _DEFAULT_PREFERENCES[type(preferred)]
+    changes = {
+        f.name: getattr(fallback, f.name)
+        for f in fields(preferred)
+        if getattr(preferred, f.name) == getattr(defaults, f.name)
+    }
+    return replace(preferred, **changes) if changes else preferred
+
+
 def _load_yaml(file_path: str) -> dict[str, Any] | None:
     """
     Load YAML configuration file.
@@ -337,13 +356,15 @@ def _load_yaml(file_path: str) -> dict[str, Any] | None:
     Returns:
         Parsed configuration dictionary, or None if YAML not available or file invalid
     """
+    if not _HAVE_YAML:
+        return None  # PyYAML not installed
     try:
-        import yaml
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            if _HAVE_LIBYAML:
+                data = yaml.load(f, Loader=yaml.CSafeLoader)
+            else:
+                data = yaml.safe_load(f)
             return data if isinstance(data, dict) else {}
-    except ImportError:
-        return None  # PyYAML not installed
     except (OSError, yaml.YAMLError):
         return None  # File not found or invalid YAML
 
@@ -359,9 +380,10 @@ def _load_json(file_path: str) -> dict[str, Any] | None:
         Parsed configuration dictionary, or None if file invalid
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+        return data if isinstance(data, dict) else {}
     except (OSError, json.JSONDecodeError):
         return None
 
@@ -370,7 +392,8 @@ def load_config_file(file_path: str, verbose: bool = False) -> Config | None:
     """
     Load configuration from a single file.
 
-    Tries YAML first, falls back to JSON if YAML not available.
+    Tries YAML first, falls back to JSON if YAML not available. Successfully
+    parsed YAML files are memoized until their mtime or size changes.
 
     Args:
         file_path: Path to configuration file
@@ -379,27 +402,47 @@ def load_config_file(file_path: str, verbose: bool = False) -> Config | None:
     Returns:
         Config object, or None if file cannot be loaded
     """
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return None
 
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    cached = _loaded_configs.get(key)
+    if cached is not None:
+        vlog(f"Using cached config: {file_path}", verbose)
+        # Config is frozen but its dicts and lists are not, so every caller gets its own copy
+        return copy.deepcopy(cached)
+
     vlog(f"Loading config from: {file_path}", verbose)
 
     # Try YAML first
     data = _load_yaml(file_path)
-    if data is None:
-        # Try JSON fallback
-        json_path = file_path.replace(".yml", ".json").replace(".yaml", ".json")
-        if os.path.exists(json_path):
-            vlog(f"YAML not available, trying JSON: {json_path}", verbose)
-            data = _load_json(json_path)
-        else:
-            vlog(f"Could not load config from {file_path} (YAML parser not available)", verbose)
-            return None
+    if data is not None:
+        config = _config_from_data(data, file_path, verbose)
+        if config is not None:
+            _forget_loaded_config(file_path)
+            _loaded_configs[key] = copy.deepcopy(config)
+        return config
+
+    # Try JSON fallback (not memoized: the key tracks the YAML file, not the JSON one)
+    json_path = file_path.replace(".yml", ".json").replace(".yaml", ".json")
+    if os.path.exists(json_path):
+        vlog(f"YAML not available, trying JSON: {json_path}", verbose)
+        data = _load_json(json_path)
+    else:
+        vlog(f"Could not load config from {file_path} (YAML parser not available)", verbose)
+        return None
 
     if data is None:
         vlog(f"Invalid config file: {file_path}", verbose)
         return None
 
+    return _config_from_data(data, file_path, verbose)
+
+
+def _config_from_data(data: dict[str, Any], file_path: str, verbose: bool) -> Config | None:
+    """Validate parsed config data, returning None (and logging why) if it is rejected."""
     try:
         config = Config.from_dict(data, source=file_path)
         vlog(f"Loaded config successfully: {file_path}", verbose)
@@ -409,6 +452,12 @@ def load_config_file(file_path: str, verbose: bool = False) -> Config | None:
         return None
 
 
+def _forget_loaded_config(file_path: str) -> None:
+    """Drop memoized parses of file_path (any mtime/size)."""
+    for key in [k for k in _loaded_configs if k[0] == file_path]:
+        del _loaded_configs[key]
+
+
 def load_config(
     custom_path: str | None = None,
     verbose: bool = False,
@@ -9,10 +9,14 @@ Detects whether running in:
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 
-from .common import is_ci_environment, get_active_user_count, get_system_uptime_days, vlog
+from .common import CI_ENV_VARS, get_active_user_count, get_ci_env_vars, get_system_uptime_days, vlog
+
+# Variables that auto-detection reads; their values key the memoized result
+_DETECTION_ENV_VARS = CI_ENV_VARS | {"DISPLAY", "WAYLAND_DISPLAY", "SSH_CONNECTION", "HOME"}
 
 
 @dataclass(frozen=True)
@@ -37,6 +41,30 @@ class Environment:
         return f"{self.mode}{override_str} (confidence: {confidence_pct}%)"
 
 
+@functools.lru_cache(maxsize=16)
+def make_environment(
+    mode: str,
+    confidence: float,
+    indicators: tuple[str, ...] = (),
+    override: bool = False,
+) -> Environment:
+    """
+    Return a shared Environment for the given field values.
+
+    Environment is frozen, so equal values can safely share one instance.
+
+    Args:
+        mode: Environment type ('ci', 'server', or 'workstation')
+        confidence: Confidence level (0.0-1.0)
+        indicators: Evidence for the detection decision
+        override: Whether mode was explicitly overridden by user
+
+    Returns:
+        Environment object (the same object for repeated identical calls)
+    """
+    return Environment(mode=mode, confidence=confidence, indicators=indicators, override=override)
+
+
 def detect_environment(override: str | None = None, verbose: bool = False) -> Environment:
     """
     Detect the environment type for context-aware installation.
@@ -67,29 +95,43 @@ def detect_environment(override: str | None = None, verbose: bool = False) -> En
                 f"Must be one of: {', '.join(sorted(valid_modes))}"
             )
         vlog(f"Environment explicitly set to: {override}", verbose)
-        return Environment(
+        return make_environment(
             mode=override,
             confidence=1.0,
             indicators=(f"explicit_override={override}",),
             override=True,
         )
 
+    env = os.environ
+    fingerprint = tuple(sorted((var, env[var]) for var in _DETECTION_ENV_VARS.intersection(env)))
+    return _detect_auto(fingerprint, verbose)
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_auto(fingerprint: tuple[tuple[str, str], ...], verbose: bool) -> Environment:
+    """
+    Run auto-detection, memoized per process on the relevant environment variables.
+
+    The probes behind it (counting login sessions, reading uptime, stat-ing paths)
+    do not change meaningfully during a run, so a repeated call with the
+    same environment reuses the first result.
+
+    Args:
+        fingerprint: Sorted (name, value) pairs of the set _DETECTION_ENV_VARS
+        verbose: Enable verbose logging
+
+    Returns:
+        Environment object with the detected mode
+    """
     # Check CI indicators (highest priority, highest confidence)
-    if is_ci_environment():
-        indicators = []
-        ci_env_vars = [
-            "CI", "GITHUB_ACTIONS", "GITLAB_CI", "CIRCLECI", "TRAVIS",
-            "JENKINS_HOME", "BUILDKITE", "DRONE", "SEMAPHORE"
-        ]
-        for var in ci_env_vars:
-            if os.environ.get(var):
-                indicators.append(f"env:{var}={os.environ[var]}")
-
-        vlog(f"CI environment detected: {indicators}", verbose)
+    ci_vars = get_ci_env_vars()
+    if ci_vars:
+        ci_indicators = tuple(f"env:{var}={os.environ[var]}" for var in ci_vars)
+        vlog(f"CI environment detected: {list(ci_indicators)}", verbose)
         return Environment(
             mode="ci",
             confidence=0.95,
-            indicators=tuple(indicators),
+            indicators=ci_indicators,
         )
 
     # Check server indicators (medium priority, medium confidence)
@@ -7,11 +7,12 @@ Supports serialization to JSON, shell scripts, and human-readable tables.
 
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass
 from typing import Sequence
 
-from .package_managers import get_package_manager
+from .package_managers import PackageManager, get_package_manager
 
 
 @dataclass(frozen=True)
@@ -219,6 +220,17 @@ class InstallPlan:
         return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=None)
+def _check_step(pm: PackageManager) -> InstallStep:
+    """Availability-check step for a package manager (identical for every tool it installs)."""
+    return InstallStep(
+        description=f"Check for {pm.display_name}",
+        command=pm.check_command,
+        requires_sudo=False,
+        estimated_time_seconds=2,
+    )
+
+
 def generate_install_plan(
     tool_name: str,
     package_name: str,
@@ -252,14 +264,7 @@ def generate_install_plan(
     warnings = []
 
     # Step 1: Check package manager availability
-    steps.append(
-        InstallStep(
-            description=f"Check for {pm.display_name}",
-            command=pm.check_command,
-            requires_sudo=False,
-            estimated_time_seconds=2,
-        )
-    )
+    steps.append(_check_step(pm))
 
     # Step 2: Install the tool
     install_cmd = pm.get_install_command(package_name, target_version)
@@ -12,7 +12,7 @@ import random
 import shutil
 import subprocess
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .common import vlog
 from .config import Config
@@ -125,6 +125,26 @@ class InstallError(Exception):
         super().__init__(message)
 
 
+# Lowercase stderr fragments that mark a failure as transient
+_RETRYABLE_STDERR = (
+    # Network-related errors
+    "connection refused",
+    "connection timed out",
+    "connection reset",
+    "temporary failure",
+    "network unreachable",
+    "could not resolve host",
+    # Package manager lock contention
+    "could not get lock",
+    "lock file exists",
+    "waiting for cache lock",
+    "dpkg frontend lock",
+)
+
+# Temporary failure exit codes: EAGAIN, connection refused, git error
+_RETRYABLE_EXIT_CODES = frozenset({75, 111, 128})
+
+
 def is_retryable_error(exit_code: int, stderr: str) -> bool:
     """
     Determine if an error is retryable.
@@ -136,31 +156,11 @@ def is_retryable_error(exit_code: int, stderr: str) -> bool:
     Returns:
         True if error is transient and should be retried
     """
-    # Network-related errors
-    if any(indicator in stderr.lower() for indicator in [
-        "connection refused",
-        "connection timed out",
-        "connection reset",
-        "temporary failure",
-        "network unreachable",
-        "could not resolve host",
-    ]):
+    if exit_code in _RETRYABLE_EXIT_CODES:
         return True
 
-    # Package manager lock contention
-    if any(indicator in stderr.lower() for indicator in [
-        "could not get lock",
-        "lock file exists",
-        "waiting for cache lock",
-        "dpkg frontend lock",
-    ]):
-        return True
-
-    # Temporary failure exit codes
-    if exit_code in {75, 111, 128}:  # EAGAIN, connection refused, git error
-        return True
-
-    return False
+    stderr_lower = stderr.lower()
+    return any(indicator in stderr_lower for indicator in _RETRYABLE_STDERR)
 
 
 def calculate_backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
@@ -297,16 +297,7 @@ def execute_step_with_retry(
 
         if result.success:
             # Update attempt number in result
-            return StepResult(
-                step=result.step,
-                success=result.success,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.exit_code,
-                duration_seconds=result.duration_seconds,
-                error_message=result.error_message,
-                attempt_number=attempt + 1,
-            )
+            return replace(result, attempt_number=attempt + 1)
 
         # Check if error is retryable
         if not is_retryable_error(result.exit_code, result.stderr):
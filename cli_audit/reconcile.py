@@ -1208,7 +1208,7 @@ def bulk_reconcile(
 
     # Detect installations in parallel
     if max_workers is None:
-        max_workers = min(16, os.cpu_count() or 4 + 4)
+        max_workers = min(16, (os.cpu_count() or 4) + 4)
 
     vlog(f"Checking {len(tools_to_check)} tools for conflicts...", verbose)
 
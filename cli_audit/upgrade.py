@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import hashlib
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys  # noqa: F401 - used by test patches
 import tempfile
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -37,6 +39,9 @@ from .package_managers import select_package_manager
 # Version cache with configurable TTL
 _version_cache: dict[tuple[str, str], tuple[str, float]] = {}
 
+# apt-cache policy line holding the installable version: "  Candidate: 14.1.1-1"
+_APT_CANDIDATE_RE = re.compile(r'Candidate:\s+([^\s]+)')
+
 
 @dataclass(frozen=True)
 class UpgradeBackup:
@@ -136,12 +141,14 @@ class UpgradeCandidate:
         available_version: Latest available version
         breaking_change: Whether upgrade is a major version bump
         package_manager: Package manager to use for upgrade
+        binary_path: Path of the installed binary (empty if unknown)
     """
     tool_name: str
     current_version: str
     available_version: str
     breaking_change: bool
     package_manager: str
+    binary_path: str = ""
 
     def version_jump_description(self) -> str:
         """Human-readable version jump description."""
@@ -209,6 +216,17 @@ def compare_versions(v1: str, v2: str) -> int:
     Returns:
         -1 if v1 < v2, 0 if v1 == v2, 1 if v1 > v2
     """
+    # Fast paths: identical strings (the common "up to date" case) and plain
+    # dotted-numeric versions of equal length need no packaging parse.
+    if v1 == v2:
+        return 0
+    parts1 = v1.split(".")
+    parts2 = v2.split(".")
+    if len(parts1) == len(parts2) and all(p.isdecimal() for p in parts1) and all(p.isdecimal() for p in parts2):
+        nums1 = tuple(map(int, parts1))
+        nums2 = tuple(map(int, parts2))
+        return (nums1 > nums2) - (nums1 < nums2)
+
     try:
         from packaging import version
         ver1 = version.parse(v1)
@@ -230,6 +248,39 @@ def compare_versions(v1: str, v2: str) -> int:
             return 0
 
 
+def _stream_first_match(argv: list[str], pattern: re.Pattern[str], timeout: float) -> re.Match[str] | None:
+    """
+    Run a command and return the first stdout line matching pattern.
+
+    Output is consumed line by line and the process is terminated as soon as a
+    match is found, so the full stdout is never buffered. A process that runs
+    to completion must exit with status 0 (a timeout kill counts as failure),
+    otherwise None is returned even if a line matched.
+    """
+    match: re.Match[str] | None = None
+    stopped_early = False
+    with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            if proc.stdout is not None:
+                for line in proc.stdout:
+                    match = pattern.search(line)
+                    if match:
+                        break
+            # Terminated by us after the match, so its exit status carries no signal
+            stopped_early = match is not None and proc.poll() is None
+            if not stopped_early:
+                proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.terminate()
+    if stopped_early:
+        return match
+    return match if proc.returncode == 0 else None
+
+
 def get_available_version(
     tool_name: str,
     package_manager: str,
@@ -310,20 +361,11 @@ def get_available_version(
         elif package_manager == "apt":
             from .catalog import resolve_apt_package_name
             apt_pkg = resolve_apt_package_name(tool_name)
-            result = subprocess.run(
-                ["apt-cache", "policy", apt_pkg],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-            if result.returncode == 0:
-                # Parse: "  Candidate: 14.1.1-1"
-                match = re.search(r'Candidate:\s+([^\s]+)', result.stdout)
-                if match:
-                    version_str = match.group(1).split('-')[0]  # Remove Debian revision
-                    _version_cache[cache_key] = (version_str, time.time())
-                    return version_str
+            match = _stream_first_match(["apt-cache", "policy", apt_pkg], _APT_CANDIDATE_RE, timeout=10)
+            if match:
+                version_str = match.group(1).split('-')[0]  # Remove Debian revision
+                _version_cache[cache_key] = (version_str, time.time())
+                return version_str
 
         elif package_manager == "brew":
             result = subprocess.run(
@@ -585,6 +627,7 @@ def upgrade_tool(
     dry_run: bool = False,
     verbose: bool = False,
     interactive: bool = True,
+    _prevalidated: tuple[str, str, str] | None = None,
 ) -> UpgradeResult:
     """
     Upgrade a single tool to a newer version.
@@ -599,6 +642,8 @@ def upgrade_tool(
         dry_run: Show what would be upgraded without executing
         verbose: Enable verbose logging
         interactive: If True, prompt user for missing prerequisites
+        _prevalidated: (binary_path, current_version, pm_name) already determined
+            by the caller (e.g. bulk_upgrade); skips re-validation and PM selection
 
     Returns:
         UpgradeResult with upgrade outcome
@@ -614,29 +659,35 @@ def upgrade_tool(
 
     start_time = time.time()
 
-    # 1. Validate tool is installed
-    success, binary_path, current_version = validate_installation(tool_name, verbose=verbose)
-    if not success or not current_version:
-        return UpgradeResult(
+    binary_path: str | None
+    if _prevalidated is not None:
+        # Steps 1-2 were already done by the caller
+        binary_path, current_version, pm_name = _prevalidated
+    else:
+        # 1. Validate tool is installed
+        success, binary_path, validated_version = validate_installation(tool_name, verbose=verbose)
+        if not success or not validated_version:
+            return UpgradeResult(
+                tool_name=tool_name,
+                success=False,
+                previous_version=None,
+                new_version=None,
+                backup=None,
+                error_message=f"Tool '{tool_name}' is not currently installed",
+                duration_seconds=time.time() - start_time,
+            )
+        current_version = validated_version
+
+        # 2. Select package manager
+        pm_name, _ = select_package_manager(
             tool_name=tool_name,
-            success=False,
-            previous_version=None,
-            new_version=None,
-            backup=None,
-            error_message=f"Tool '{tool_name}' is not currently installed",
-            duration_seconds=time.time() - start_time,
+            language=None,
+            config=config,
+            env=env,
+            verbose=verbose,
         )
 
     vlog(f"Current version: {current_version}", verbose)
-
-    # 2. Select package manager
-    pm_name, reason = select_package_manager(
-        tool_name=tool_name,
-        language=None,
-        config=config,
-        env=env,
-        verbose=verbose,
-    )
     vlog(f"Using package manager: {pm_name}", verbose)
 
     # 3. Determine target version
@@ -794,6 +845,15 @@ def upgrade_tool(
         raise
 
 
+def _drain_log_queue(log_q: queue.Queue[str | None], verbose: bool) -> None:
+    """Log queued messages until the None sentinel arrives."""
+    while True:
+        msg = log_q.get()
+        if msg is None:
+            return
+        vlog(msg, verbose)
+
+
 def get_upgrade_candidates(
     mode: str,
     tool_names: Sequence[str] | None,
@@ -829,7 +889,7 @@ def get_upgrade_candidates(
     cache_ttl = config.preferences.cache_ttl_seconds
     for tool in tools_to_check:
         # Check if installed
-        success, _, current_version = validate_installation(tool, verbose=verbose)
+        success, binary_path, current_version = validate_installation(tool, verbose=verbose)
         if not success or not current_version:
             vlog(f"{tool}: not installed, skipping", verbose)
             continue
@@ -848,6 +908,7 @@ def get_upgrade_candidates(
                 available_version=available,
                 breaking_change=is_breaking,
                 package_manager=pm_name,
+                binary_path=binary_path or "",
             ))
             vlog(f"{tool}: {current} → {available} {'(BREAKING)' if is_breaking else ''}", verbose)
         else:
@@ -922,6 +983,10 @@ def bulk_upgrade(
             blocked.extend([c for c in allowed if c.breaking_change])
             allowed = still_allowed
 
+    # Shared by every result built below
+    tools_attempted = tuple(c.tool_name for c in allowed)
+    breaking_changes_count = sum(1 for c in candidates if c.breaking_change)
+
     if dry_run:
         # Show what would be upgraded
         vlog(f"Dry-run: would upgrade {len(allowed)} tools", verbose)
@@ -931,12 +996,12 @@ def bulk_upgrade(
             vlog(f"  {candidate.tool_name}: BLOCKED (breaking change)", verbose)
 
         return BulkUpgradeResult(
-            tools_attempted=tuple(c.tool_name for c in allowed),
+            tools_attempted=tools_attempted,
             upgrades=(),
             skipped=tuple(c.tool_name for c in blocked),
             failures=(),
             duration_seconds=time.time() - start_time,
-            breaking_changes_count=len([c for c in candidates if c.breaking_change]),
+            breaking_changes_count=breaking_changes_count,
             rollbacks_executed=0,
         )
 
@@ -968,12 +1033,12 @@ def bulk_upgrade(
                 if not prompt_install_all_prerequisites(missing, "selected tools"):
                     # User declined - can't proceed
                     return BulkUpgradeResult(
-                        tools_attempted=tuple(c.tool_name for c in allowed),
+                        tools_attempted=tools_attempted,
                         upgrades=(),
-                        skipped=tuple(c.tool_name for c in allowed),
+                        skipped=tools_attempted,
                         failures=(),
                         duration_seconds=time.time() - start_time,
-                        breaking_changes_count=len([c for c in candidates if c.breaking_change]),
+                        breaking_changes_count=breaking_changes_count,
                         rollbacks_executed=0,
                     )
 
@@ -994,12 +1059,12 @@ def bulk_upgrade(
                     if not prereq_result.success:
                         vlog(f"Failed to install prerequisite {prereq}: {prereq_result.error_message}", verbose)
                         return BulkUpgradeResult(
-                            tools_attempted=tuple(c.tool_name for c in allowed),
+                            tools_attempted=tools_attempted,
                             upgrades=(),
-                            skipped=tuple(c.tool_name for c in allowed),
+                            skipped=tools_attempted,
                             failures=(),
                             duration_seconds=time.time() - start_time,
-                            breaking_changes_count=len([c for c in candidates if c.breaking_change]),
+                            breaking_changes_count=breaking_changes_count,
                             rollbacks_executed=0,
                         )
                     vlog(f"Prerequisite {prereq} installed successfully", verbose)
@@ -1008,18 +1073,41 @@ def bulk_upgrade(
     upgrades: list[UpgradeResult] = []
     failures: list[UpgradeResult] = []
 
-    # Determine max workers
+    # Determine max workers; never start more threads than there are upgrades
     if max_workers is None:
-        import os
-        max_workers = min(16, os.cpu_count() or 4 + 4)
+        max_workers = min(16, (os.cpu_count() or 4) + 4)
+    max_workers = max(1, min(max_workers, len(allowed)))
 
     vlog(f"Upgrading {len(allowed)} tools with {max_workers} workers...", verbose)
 
+    # When logging is on, per-result messages go to a background thread so the
+    # completion loop below never waits on log I/O
+    log_q: queue.Queue[str | None] | None = None
+    log_thread = None
+    if verbose or os.environ.get("CLI_AUDIT_DEBUG", "0") == "1":
+        log_q = queue.Queue(maxsize=10000)
+        log_thread = threading.Thread(
+            target=_drain_log_queue, args=(log_q, verbose), name="bulk-upgrade-log", daemon=True,
+        )
+        log_thread.start()
+
+    def log(msg: str) -> None:
+        if log_q is None:
+            return
+        try:
+            log_q.put_nowait(msg)
+        except queue.Full:
+            vlog(msg, verbose)
+
     # Use ThreadPoolExecutor
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_candidate = {
-            executor.submit(
-                upgrade_tool,
+        submit = executor.submit
+        upgrade = upgrade_tool
+        future_to_candidate = {}
+        for candidate in allowed:
+            binary_path = candidate.binary_path
+            future = submit(
+                upgrade,
                 tool_name=candidate.tool_name,
                 target_version=candidate.available_version,
                 config=config,
@@ -1029,9 +1117,12 @@ def bulk_upgrade(
                 dry_run=False,
                 verbose=verbose,
                 interactive=False,  # Prerequisites already handled
-            ): candidate
-            for candidate in allowed
-        }
+                _prevalidated=(
+                    (binary_path, candidate.current_version, candidate.package_manager)
+                    if binary_path else None
+                ),
+            )
+            future_to_candidate[future] = candidate
 
         for future in as_completed(future_to_candidate):
             candidate = future_to_candidate[future]
@@ -1039,12 +1130,12 @@ def bulk_upgrade(
                 result = future.result()
                 if result.success:
                     upgrades.append(result)
-                    vlog(f"✓ {result.tool_name}: {result.previous_version} → {result.new_version}", verbose)
+                    log(f"✓ {result.tool_name}: {result.previous_version} → {result.new_version}")
                 else:
                     failures.append(result)
-                    vlog(f"✗ {result.tool_name}: {result.error_message}", verbose)
+                    log(f"✗ {result.tool_name}: {result.error_message}")
             except Exception as e:
-                vlog(f"Unexpected error upgrading {candidate.tool_name}: {e}", verbose)
+                log(f"Unexpected error upgrading {candidate.tool_name}: {e}")
                 # Create failure result
                 failures.append(UpgradeResult(
                     tool_name=candidate.tool_name,
@@ -1055,14 +1146,18 @@ def bulk_upgrade(
                     error_message=str(e),
                 ))
 
+    if log_q is not None and log_thread is not None:
+        log_q.put(None)
+        log_thread.join()
+
     duration = time.time() - start_time
 
     return BulkUpgradeResult(
-        tools_attempted=tuple(c.tool_name for c in allowed),
+        tools_attempted=tools_attempted,
         upgrades=tuple(upgrades),
         skipped=tuple(c.tool_name for c in blocked),
         failures=tuple(failures),
         duration_seconds=duration,
-        breaking_changes_count=len([c for c in candidates if c.breaking_change]),
+        breaking_changes_count=breaking_changes_count,
         rollbacks_executed=sum(1 for r in failures if r.rollback_executed),
     )
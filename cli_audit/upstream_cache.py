@@ -9,20 +9,31 @@ upstream versions that can be committed to the repository.
 from __future__ import annotations
 
 import datetime
+import functools
 import json
 import os
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional C serializer; output is byte-identical to the json fallback
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
 # Default upstream cache file location
 DEFAULT_UPSTREAM_FILE = "upstream_versions.json"
 
 # Cache staleness threshold (7 days)
 DEFAULT_MAX_AGE_HOURS = 168
 
+# Parsed caches keyed by (path, st_mtime_ns, st_size); a changed file gets a new key
+_loaded_caches: dict[tuple[str, int, int], UpstreamCache] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class UpstreamVersion:
     """Upstream version information for a tool."""
 
@@ -54,7 +65,21 @@ class UpstreamVersion:
         )
 
 
-@dataclass
+_VERSION_FIELDS = frozenset(("latest_tag", "latest_version", "latest_url", "tool_url", "upstream_method"))
+
+
+def _version_object_hook(obj: dict[str, Any]) -> Any:
+    """json object_hook: decode per-tool entries straight into UpstreamVersion.
+
+    Any non-empty object whose keys are all UpstreamVersion fields is taken
+    as a version entry; everything else is left as a dict for from_dict().
+    """
+    if obj and _VERSION_FIELDS.issuperset(obj):
+        return UpstreamVersion(**obj)
+    return obj
+
+
+@dataclass(slots=True)
 class UpstreamCache:
     """Container for upstream version cache with metadata."""
 
@@ -82,8 +107,9 @@ class UpstreamCache:
         meta = data.get("__meta__", {})
         versions_raw = data.get("versions", {})
 
+        # Entries may already be decoded by _version_object_hook
         versions = {
-            name: UpstreamVersion.from_dict(ver_data)
+            name: ver_data if isinstance(ver_data, UpstreamVersion) else UpstreamVersion.from_dict(ver_data)
             for name, ver_data in versions_raw.items()
         }
 
@@ -119,18 +145,43 @@ def load_upstream_cache(path: Path | None = None) -> UpstreamCache:
     if path is None:
         path = get_upstream_cache_path()
 
-    if not path.exists():
-        return UpstreamCache()
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                return UpstreamCache()
-            return UpstreamCache.from_dict(data)
-    except Exception:
+        st = path.stat()
+    except OSError:
         return UpstreamCache()
 
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _loaded_caches.get(key)
+    if cached is None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f, object_hook=_version_object_hook)
+                if not isinstance(data, dict):
+                    return UpstreamCache()
+                cached = UpstreamCache.from_dict(data)
+        except Exception:
+            return UpstreamCache()
+        _forget_loaded_cache(path)
+        _loaded_caches[key] = cached
+
+    # Callers may add, replace or edit entries, so hand out copies of each one
+    return replace(cached, versions={name: replace(ver) for name, ver in cached.versions.items()})
+
+
+def _forget_loaded_cache(path: Path) -> None:
+    """Drop memoized parses of path (any mtime/size)."""
+    name = str(path)
+    for key in [k for k in _loaded_caches if k[0] == name]:
+        del _loaded_caches[key]
+
+
+def _dump_cache_bytes(data: dict[str, Any]) -> bytes:
+    """Serialize cache data as indented, key-sorted UTF-8 JSON."""
+    if _HAVE_ORJSON:
+        payload: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        return payload
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
 
 def write_upstream_cache(
     cache: UpstreamCache,
@@ -153,14 +204,23 @@ def write_upstream_cache(
         .replace("+00:00", "Z")
     )
 
-    # Atomic write: write to temp file then rename
+    # Atomic write: write bytes to temp file, fsync, then rename over the target
     try:
+        payload = _dump_cache_bytes(cache.to_dict())
         temp_path = path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(cache.to_dict(), f, indent=2, ensure_ascii=False, sort_keys=True)
-        temp_path.replace(path)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
     except Exception as e:
         raise IOError(f"Failed to write upstream cache: {e}")
+    finally:
+        _forget_loaded_cache(path)
 
 
 def get_cached_upstream(tool_name: str, cache: UpstreamCache) -> UpstreamVersion | None:
@@ -191,6 +251,18 @@ def update_cached_upstream(
     cache.versions[tool_name] = version
 
 
+@functools.lru_cache(maxsize=32)
+def _timestamp_epoch(timestamp: str) -> float | None:
+    """Parse an ISO-8601 UTC timestamp ("...Z") to epoch seconds, None if invalid."""
+    try:
+        parsed = datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None  # Naive timestamps can't be compared against UTC now
+    return parsed.timestamp()
+
+
 def is_cache_stale(cache: UpstreamCache, max_age_hours: int = DEFAULT_MAX_AGE_HOURS) -> bool:
     """Check if cache is stale (older than max_age_hours).
 
@@ -204,16 +276,11 @@ def is_cache_stale(cache: UpstreamCache, max_age_hours: int = DEFAULT_MAX_AGE_HO
     if not cache.baseline_updated_at:
         return True
 
-    try:
-        # Parse ISO timestamp
-        updated_at = datetime.datetime.fromisoformat(
-            cache.baseline_updated_at.replace("Z", "+00:00")
-        )
-        now = datetime.datetime.now(datetime.timezone.utc)
-        age = now - updated_at
-        return age.total_seconds() > (max_age_hours * 3600)
-    except Exception:
+    # The timestamp string is parsed once; later checks are a float compare
+    updated_at = _timestamp_epoch(cache.baseline_updated_at)
+    if updated_at is None:
         return True
+    return (time.time() - updated_at) > (max_age_hours * 3600)
 
 
 def migrate_from_snapshot(snapshot: dict[str, Any]) -> UpstreamCache:
@@ -21,6 +21,7 @@ import os
 import signal
 import re
 import argparse
+import functools
 import unicodedata
 
 # --- ANSI / OSC 8 handling ---
@@ -30,17 +31,23 @@ CSI_RE = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
 # We need to *remove* the open/close sequences for width calc but leave TEXT intact.
 OSC8_OPEN_RE = re.compile(r'\x1b\]8;[^\\]*\\')
 OSC8_CLOSE_RE = re.compile(r'\x1b\]8;;\\')
+# All of the above in one alternation so each cell is scanned once.
+# (OSC8_OPEN_RE also matches the close sequence, whose params are empty.)
+ANSI_RE = re.compile('|'.join((OSC8_OPEN_RE.pattern, OSC8_CLOSE_RE.pattern, CSI_RE.pattern)))
 
 
 def strip_control_for_width(s: str) -> str:
+    # Every sequence we strip starts with ESC; plain cells skip the regex
+    if '\x1b' not in s:
+        return s
     # Remove only the control sequences, not the link text
-    s = OSC8_OPEN_RE.sub('', s)
-    s = OSC8_CLOSE_RE.sub('', s)
-    s = CSI_RE.sub('', s)
-    return s
+    return ANSI_RE.sub('', s)
 
 
 # --- wcwidth / wcswidth ---
+# Memoized per code point: real tables reuse a small alphabet, so after the first
+# few rows every lookup is a dict hit instead of three unicodedata queries.
+@functools.lru_cache(maxsize=None)
 def _fallback_wcwidth(char: str) -> int:
     # Combining marks (including ZWJ) have zero width
     if unicodedata.combining(char):
@@ -92,22 +99,44 @@ except Exception:
         return _fallback_wcwidth(c)
 
     def wcswidth(s: str) -> int:
-        width = 0
-        for ch in s:
-            w = wcwidth(ch)
-            if w < 0:
-                return -1
-            width += w
-        return width
+        # Every ASCII code point (controls included) is width 1 in the fallback
+        if s.isascii():
+            return len(s)
+        # The fallback never yields a negative width, so no early exit is needed
+        return sum(map(_fallback_wcwidth, s))
 
     _USING_LIB_WCWIDTH = False
 
-# Numeric detection
-NUM_RE = re.compile(r'^[ \t]*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?[ \t]*$')
 
+@functools.lru_cache(maxsize=None)
+def visible_cell(cell: str) -> tuple[str, int]:
+    """Return (text without control sequences, display width) for a cell."""
+    visible = strip_control_for_width(cell)
+    w = wcswidth(visible)
+    if w < 0:
+        w = len(visible)  # fallback, should rarely happen
+    return visible, w
 
+
+# Numeric detection: [+-]? (digits[.digits?] | .digits) ([eE][+-]?digits)?, surrounded
+# by optional blanks. Hand-rolled with str methods; isdecimal() matches what \d did.
+@functools.lru_cache(maxsize=None)
 def looks_numeric(s: str) -> bool:
-    return bool(NUM_RE.match(s))
+    s = s.strip(' \t')
+    if s[:1] in ('+', '-'):
+        s = s[1:]
+    mantissa, has_exp, exponent = s.replace('E', 'e').partition('e')
+    if has_exp:
+        if exponent[:1] in ('+', '-'):
+            exponent = exponent[1:]
+        if not exponent.isdecimal():
+            return False
+    int_part, has_dot, frac_part = mantissa.partition('.')
+    if not has_dot:
+        return int_part.isdecimal()
+    if not int_part:
+        return frac_part.isdecimal()
+    return int_part.isdecimal() and (not frac_part or frac_part.isdecimal())
 
 
 def parse_args():
@@ -138,54 +167,78 @@ def decode_separator(raw: str) -> str:
     return bytes(body, 'utf-8').decode('unicode_escape')
 
 
-def split_line(line: str, sep: str, collapse: bool) -> list[str]:
+def read_rows(stream, sep: str, collapse: bool, trim: bool) -> list[list[str]]:
+    # Read the whole input in one call and split it with C-level str/re methods
+    # rather than iterating and splitting line by line.
+    lines = stream.read().split('\n')
+    if lines[-1] == '':
+        lines.pop()  # trailing newline (or empty input)
     if collapse:
         # Treat separator as a literal char and split on 1+ occurrences
-        pattern = re.escape(sep) + r'+'
-        return re.split(pattern, line.rstrip('\n'))
+        split = re.compile(re.escape(sep) + r'+').split
+        rows = [split(line) for line in lines]
     else:
-        return line.rstrip('\n').split(sep)
+        rows = [line.split(sep) for line in lines]
+    if trim:
+        strip = str.strip
+        rows = [list(map(strip, parts)) for parts in rows]
+    return rows
 
 
-def compute_col_widths(rows: list[list[str]]) -> list[int]:
+def compute_col_widths(rows: list[list[str]], visible_widths: list[list[int]]) -> list[int]:
+    # visible_widths[r][i] is the display width of rows[r][i], computed once at ingest
     if not rows:
         return []
     ncol = max(len(r) for r in rows)
     widths = [0] * ncol
-    for r in rows:
-        for i, cell in enumerate(r):
-            visible = strip_control_for_width(cell)
-            w = wcswidth(visible)
-            if w < 0:
-                w = len(visible)  # fallback, should rarely happen
+    for vw_row in visible_widths:
+        for i, w in enumerate(vw_row):
             if w > widths[i]:
                 widths[i] = w
     return widths
 
 
-def format_rows(rows, widths, pad, right_cols, num_right, header):
-    out_lines = []
+def format_rows(rows, visible_widths, widths, pad, right_cols, num_right, header):
+    # Generator: lines are produced lazily so the output is never held in full
+    padding = ' ' * (max(widths) if widths else 0)
+    sep = ' ' * pad
+    # draw a rule based on widths and pad
+    rule = sep.join('-' * w for w in widths)
     for ridx, r in enumerate(rows):
+        vw_row = visible_widths[ridx]
         cells = []
         for i in range(len(widths)):
-            cell = r[i] if i < len(r) else ''
-            visible = strip_control_for_width(cell)
-            w = wcswidth(visible)
-            if w < 0:
-                w = len(visible)
+            if i < len(r):
+                cell = r[i]
+                w = vw_row[i]
+            else:
+                cell = ''
+                w = 0
             space = widths[i] - w
-            align_right = (i in right_cols) or (num_right and looks_numeric(visible))
+            align_right = (i in right_cols) or (num_right and looks_numeric(visible_cell(cell)[0]))
             if align_right:
-                cells.append(' ' * space + cell)
+                cells.append(padding[:space] + cell)
             else:
-                cells.append(cell + ' ' * space)
-        line = (' ' * pad).join(cells)
-        out_lines.append(line)
+                cells.append(cell + padding[:space])
+        yield sep.join(cells)
         if header and ridx == 0:
-            # draw a rule based on widths and pad
-            rule_cells = ['-' * w for w in widths]
-            out_lines.append((' ' * pad).join(rule_cells))
-    return out_lines
+            yield rule
+
+
+WRITE_BATCH = 1024
+
+
+def write_lines(lines) -> None:
+    # One write() per WRITE_BATCH lines instead of one print() per line
+    buf = []
+    for line in lines:
+        buf.append(line)
+        if len(buf) >= WRITE_BATCH:
+            sys.stdout.write('\n'.join(buf) + '\n')
+            buf.clear()
+    if buf:
+        sys.stdout.write('\n'.join(buf) + '\n')
+    sys.stdout.flush()
 
 
 def main():
@@ -204,17 +257,12 @@ def main():
                 idx = int(tok) - 1
                 if idx >= 0:
                     right_cols.add(idx)
-    rows = []
-    for line in sys.stdin:
-        parts = split_line(line, sep, args.collapse)
-        if not args.no_trim:
-            parts = [p.strip() for p in parts]
-        rows.append(parts)
+    rows = read_rows(sys.stdin, sep, args.collapse, not args.no_trim)
     if not args.table:
         # Just re-join
         try:
-            for r in rows:
-                print((' ' * args.pad).join(r))
+            joiner = ' ' * args.pad
+            write_lines(joiner.join(r) for r in rows)
         except BrokenPipeError:
             try:
                 sys.stdout.close()
@@ -222,12 +270,12 @@ def main():
                 pass
             os._exit(0)
         return
-    widths = compute_col_widths(rows)
+    visible_widths = [[visible_cell(p)[1] for p in parts] for parts in rows]
+    widths = compute_col_widths(rows, visible_widths)
     if args.debug_width:
         print(f"# Using {'wcwidth' if _USING_LIB_WCWIDTH else 'fallback'}; widths={widths}", file=sys.stderr)
     try:
-        for line in format_rows(rows, widths, args.pad, right_cols, args.num_right, args.header):
-            print(line)
+        write_lines(format_rows(rows, visible_widths, widths, args.pad, right_cols, args.num_right, args.header))
     except BrokenPipeError:
         try:
             sys.stdout.close()
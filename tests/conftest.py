@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures for the cli_audit test suite.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cli_audit.config import Config
+from cli_audit.environment import Environment, make_environment
+
+from .paths import CATALOG_DIR, SCRIPTS_DIR
+
+try:
+    from orjson import loads as _json_loads  # Optional C parser; raises a json.JSONDecodeError subclass
+except ImportError:
+    _json_loads = json.loads
+
+
+def _load_catalog(path: Path) -> tuple[str, dict]:
+    """Read and parse one catalog file, failing the test run with its name if it is not JSON."""
+    try:
+        return path.stem, _json_loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        pytest.fail(f"{path.name} is not valid JSON: {e}")
+
+
+@pytest.fixture(scope="session")
+def base_config() -> Config:
+    """Default Config shared by tests that only pass it through (Config is frozen)."""
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def base_env() -> Environment:
+    """Workstation Environment shared by tests that only pass it through (Environment is frozen)."""
+    return make_environment("workstation", 1.0)
+
+
+@pytest.fixture
+def clean_env(monkeypatch) -> dict[str, str]:
+    """Swap os.environ for an empty dict for one test and return it for the test to fill.
+
+    Cheaper than patch.dict(os.environ, clear=True), which copies the whole
+    inherited environment in and back out. Code under test must read the
+    environment through os.environ / os.getenv (not os.environ captured at import).
+    """
+    env: dict[str, str] = {}
+    monkeypatch.setattr(os, "environ", env)
+    return env
+
+
+@pytest.fixture(scope="session")
+def catalog_data() -> dict[str, dict]:
+    """Parsed catalog/*.json entries keyed by file stem, read once per session.
+
+    Files are read on a small thread pool: read() releases the GIL, so the
+    per-file I/O latency overlaps on cold-cache CI runners.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(executor.map(_load_catalog, sorted(CATALOG_DIR.glob("*.json"))))
+
+
+@pytest.fixture(scope="session")
+def script_texts() -> dict[str, str]:
+    """Contents of scripts/*.sh keyed by file name, read once per session."""
+    return {path.name: path.read_text() for path in sorted(SCRIPTS_DIR.glob("*.sh"))}
+
+
+@pytest.fixture(scope="session")
+def script_stats() -> dict[str, os.stat_result]:
+    """stat() results for scripts/*.sh keyed by file name, taken once per session."""
+    return {path.name: path.stat() for path in sorted(SCRIPTS_DIR.glob("*.sh"))}
@@ -0,0 +1,10 @@
+"""
+Repository paths shared by the test modules and conftest.py.
+"""
+
+from pathlib import Path
+
+# Get the project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+CATALOG_DIR = PROJECT_ROOT / "catalog"
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
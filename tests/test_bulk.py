@@ -5,6 +5,7 @@ Tests for bulk installation operations.
 from __future__ import annotations
 
 import os
+import statistics
 import sys
 import tempfile
 import threading
@@ -27,7 +28,7 @@ from cli_audit.bulk import (
     resolve_dependencies,
 )
 from cli_audit.config import Config, Preferences, ToolConfig
-from cli_audit.environment import Environment
+from cli_audit.install_plan import InstallStep
 from cli_audit.installer import InstallResult, StepResult
 
 # Skip marker for Windows (rollback scripts are Unix shell scripts)
@@ -64,6 +65,12 @@ class TestToolSpec:
         assert spec.language == "python"
         assert spec.dependencies == ("python", "pip")
 
+    def test_toolspec_has_no_instance_dict(self):
+        """Test ToolSpec uses __slots__ (no per-instance __dict__)."""
+        spec = ToolSpec(tool_name="ripgrep", package_name="ripgrep")
+        assert not hasattr(spec, "__dict__")
+        assert hash(spec) == hash(ToolSpec(tool_name="ripgrep", package_name="ripgrep"))
+
     def test_toolspec_to_dict(self):
         """Test ToolSpec serialization."""
         spec = ToolSpec(
@@ -89,6 +96,7 @@ class TestProgressTracker:
         tracker = ProgressTracker()
         assert tracker._progress == {}
         assert tracker._callbacks == []
+        assert not hasattr(tracker, "__dict__")
 
     def test_progress_tracker_update(self):
         """Test updating progress."""
@@ -164,6 +172,96 @@ class TestProgressTracker:
 
         # Should have all 5 tools tracked without corruption
         assert len(tracker.get_all_progress()) == 5
+        assert tracker.get_summary()["in_progress"] == 5
+
+    @pytest.mark.perf
+    def test_progress_tracker_update_latency_under_contention(self):
+        """Test p99 update() latency stays low with 8 threads hammering one tracker."""
+        tracker = ProgressTracker()
+        latencies: list[list[int]] = [[] for _ in range(8)]
+        start = threading.Barrier(8)
+
+        def hammer(worker):
+            record = latencies[worker].append
+            clock = time.perf_counter_ns
+            start.wait()
+            for _ in range(10_000):
+                began = clock()
+                tracker.update(f"tool{worker}", "in_progress", "step")
+                record(clock() - began)
+
+        threads = [threading.Thread(target=hammer, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        samples = [ns for worker in latencies for ns in worker]
+        p99_ns = statistics.quantiles(samples, n=100)[98]
+        # An uncontended update takes a few microseconds; 1 ms leaves room for
+        # GIL hand-offs while still catching a lock held across slow work
+        assert p99_ns < 1_000_000, f"p99 update latency {p99_ns / 1000:.1f}us"
+
+    def test_progress_tracker_publishes_new_map(self):
+        """Test updates replace the progress map, leaving earlier snapshots intact."""
+        tracker = ProgressTracker()
+        tracker.update("ripgrep", "pending")
+        published = tracker._progress
+
+        tracker.update("ripgrep", "success")
+
+        assert published["ripgrep"][0] == "pending"
+        assert tracker.get_progress("ripgrep")["status"] == "success"
+
+    def test_progress_tracker_summary_tracks_transitions(self):
+        """Test a tool moving between statuses is counted once, under its latest status."""
+        tracker = ProgressTracker()
+        tracker.update("ripgrep", "pending")
+        tracker.update("ripgrep", "in_progress")
+        tracker.update("ripgrep", "success", "v14.1.1")
+
+        summary = tracker.get_summary()
+        assert summary == {"pending": 0, "in_progress": 0, "success": 1, "failed": 0, "skipped": 0}
+
+    def test_progress_tracker_callback_can_read_tracker(self):
+        """Test callbacks run outside the lock and may query the tracker."""
+        tracker = ProgressTracker()
+        summaries = []
+        tracker.register_callback(lambda tool_name, status, message: summaries.append(tracker.get_summary()))
+
+        tracker.update("ripgrep", "success")
+
+        assert summaries[0]["success"] == 1
+
+    def test_progress_tracker_batch_callback(self):
+        """Test batch callbacks get coalesced events, with flush() delivering the rest."""
+        tracker = ProgressTracker(callback_min_interval_s=3600, callback_batch_size=3)
+        per_event = []
+        batches = []
+        tracker.register_callback(lambda *event: per_event.append(event))
+        tracker.register_batch_callback(batches.append)
+
+        for i in range(5):
+            tracker.update(f"tool{i}", "success")
+
+        assert len(per_event) == 5
+        assert batches == [[("tool0", "success", ""), ("tool1", "success", ""), ("tool2", "success", "")]]
+
+        tracker.flush()
+        assert batches[1] == [("tool3", "success", ""), ("tool4", "success", "")]
+
+        tracker.flush()  # Nothing pending, no empty batch
+        assert len(batches) == 2
+
+    def test_progress_tracker_batch_callback_interval(self):
+        """Test pending events are delivered once the interval elapses."""
+        tracker = ProgressTracker(callback_min_interval_s=0, callback_batch_size=100)
+        batches = []
+        tracker.register_batch_callback(batches.append)
+
+        tracker.update("ripgrep", "success")
+
+        assert batches == [[("ripgrep", "success", "")]]
 
 
 class TestBulkInstallResult:
@@ -182,11 +280,10 @@ class TestBulkInstallResult:
         assert result.successes == ()
         assert result.duration_seconds == 5.0
         assert result.rollback_script is None
+        assert not hasattr(result, "__dict__")
 
     def test_bulk_install_result_to_dict(self):
         """Test BulkInstallResult serialization."""
-        from cli_audit.install_plan import InstallStep
-
         step_result = StepResult(
             step=InstallStep("test", ("echo", "test")),
             success=True,
@@ -225,43 +322,114 @@ class TestBulkInstallResult:
 class TestGetMissingTools:
     """Tests for get_missing_tools function."""
 
-    @patch("cli_audit.bulk.shutil.which")
-    def test_get_missing_tools_all_missing(self, mock_which):
+    @staticmethod
+    def _fake_path(tmp_path, monkeypatch, installed):
+        """Point PATH at a directory holding executables for the installed names."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        for name in installed:
+            (bin_dir / name).write_text("#!/bin/sh\n")
+            (bin_dir / name).chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+
+    @skip_on_windows
+    def test_get_missing_tools_all_missing(self, tmp_path, monkeypatch):
         """Test when all tools are missing."""
-        mock_which.return_value = None
+        self._fake_path(tmp_path, monkeypatch, [])
 
         tools = ["ripgrep", "black", "mypy"]
         missing = get_missing_tools(tools)
 
         assert missing == tools
-        assert mock_which.call_count == 3
 
-    @patch("cli_audit.bulk.shutil.which")
-    def test_get_missing_tools_all_installed(self, mock_which):
+    @skip_on_windows
+    def test_get_missing_tools_all_installed(self, tmp_path, monkeypatch):
         """Test when all tools are installed."""
-        mock_which.return_value = "/usr/bin/tool"
+        self._fake_path(tmp_path, monkeypatch, ["ripgrep", "black", "mypy"])
 
         tools = ["ripgrep", "black", "mypy"]
         missing = get_missing_tools(tools)
 
         assert missing == []
-        assert mock_which.call_count == 3
 
-    @patch("cli_audit.bulk.shutil.which")
-    def test_get_missing_tools_mixed(self, mock_which):
+    @skip_on_windows
+    def test_get_missing_tools_mixed(self, tmp_path, monkeypatch):
         """Test when some tools are installed."""
-        def which_side_effect(tool):
-            if tool in ("ripgrep", "mypy"):
-                return "/usr/bin/" + tool
-            return None
-
-        mock_which.side_effect = which_side_effect
+        self._fake_path(tmp_path, monkeypatch, ["ripgrep", "mypy"])
 
         tools = ["ripgrep", "black", "mypy"]
         missing = get_missing_tools(tools)
 
         assert missing == ["black"]
 
+    @skip_on_windows
+    @patch("cli_audit.bulk.shutil.which")
+    def test_get_missing_tools_scans_path_once(self, mock_which, tmp_path, monkeypatch):
+        """Test lookups go through one _prescan_path scan, not shutil.which per tool."""
+        from cli_audit.bulk import _prescan_path
+
+        self._fake_path(tmp_path, monkeypatch, ["ripgrep"])
+
+        with patch("cli_audit.bulk._prescan_path", wraps=_prescan_path) as mock_prescan:
+            missing = get_missing_tools(["ripgrep", "black", "ripgrep"])
+
+        assert missing == ["black"]
+        mock_prescan.assert_called_once()
+        assert mock_which.call_count == 0
+
+    @patch("cli_audit.bulk.shutil.which")
+    def test_get_missing_tools_uses_path_index(self, mock_which):
+        """Test a prescanned PATH index replaces per-tool shutil.which calls."""
+        missing = get_missing_tools(["ripgrep", "black"], path_index={"ripgrep": "/usr/bin/ripgrep"})
+
+        assert missing == ["black"]
+        assert mock_which.call_count == 0
+
+    @skip_on_windows
+    def test_prescan_path_matches_which(self, tmp_path, monkeypatch):
+        """Test _prescan_path finds the first executable in PATH order, like shutil.which."""
+        import shutil
+
+        from cli_audit.bulk import _prescan_path
+
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "tool").write_text("")  # Not executable, skipped
+        (second / "tool").write_text("#!/bin/sh\n")
+        (second / "tool").chmod(0o755)
+        (first / "other").mkdir()  # Directories never match
+        monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(tmp_path / "absent"), str(second)]))
+
+        index = _prescan_path(["tool", "other", "missing"])
+
+        assert index == {"tool": str(second / "tool")}
+        assert index["tool"] == shutil.which("tool")
+
+    @skip_on_windows
+    def test_prescan_path_reuses_unchanged_listings(self, tmp_path, monkeypatch):
+        """Test repeat scans skip scandir until a PATH directory changes."""
+        from cli_audit.bulk import _prescan_path
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "rg").write_text("#!/bin/sh\n")
+        (bin_dir / "rg").chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+
+        with patch("cli_audit.bulk.os.scandir", wraps=os.scandir) as mock_scandir:
+            assert _prescan_path(["rg", "fd"]) == {"rg": str(bin_dir / "rg")}
+            assert _prescan_path(["rg", "fd"]) == {"rg": str(bin_dir / "rg")}
+            assert mock_scandir.call_count == 1
+
+            # A new install changes the directory mtime and invalidates the listing
+            (bin_dir / "fd").write_text("#!/bin/sh\n")
+            (bin_dir / "fd").chmod(0o755)
+            os.utime(bin_dir, ns=(0, bin_dir.stat().st_mtime_ns + 1_000_000_000))
+
+            assert _prescan_path(["rg", "fd"]) == {"rg": str(bin_dir / "rg"), "fd": str(bin_dir / "fd")}
+            assert mock_scandir.call_count == 2
+
 
 class TestResolveDependencies:
     """Tests for resolve_dependencies function."""
@@ -338,6 +506,36 @@ class TestResolveDependencies:
         assert len(levels) == 1
         assert len(levels[0]) == 2
 
+    def test_resolve_dependencies_cycle(self):
+        """Test tools in (or behind) a dependency cycle end up in a final level."""
+        specs = [
+            ToolSpec("base", "base"),
+            ToolSpec("a", "a", dependencies=("base", "b")),
+            ToolSpec("b", "b", dependencies=("a",)),
+            ToolSpec("app", "app", dependencies=("a",)),
+        ]
+
+        levels = resolve_dependencies(specs)
+
+        assert [[s.tool_name for s in level] for level in levels] == [["base"], ["a", "b", "app"]]
+
+    def test_resolve_dependencies_repeated_call_is_cached(self):
+        """Test repeated resolution of the same specs reuses the cached levels."""
+        from cli_audit.bulk import _resolve_levels
+
+        specs = [
+            ToolSpec("lib", "lib"),
+            ToolSpec("app", "app", dependencies=("lib",)),
+        ]
+
+        _resolve_levels.cache_clear()
+        first = resolve_dependencies(specs)
+        first[0].append(ToolSpec("extra", "extra"))  # Mutating a result must not leak into the cache
+        second = resolve_dependencies(specs)
+
+        assert _resolve_levels.cache_info().hits == 1
+        assert [[s.tool_name for s in level] for level in second] == [["lib"], ["app"]]
+
 
 class TestGetToolsToInstall:
     """Tests for get_tools_to_install function."""
@@ -359,15 +557,13 @@ class TestGetToolsToInstall:
         assert specs[1].tool_name == "black"
         assert specs[1].target_version == "latest"
 
-    def test_get_tools_explicit_mode_empty(self):
+    def test_get_tools_explicit_mode_empty(self, base_config):
         """Test explicit mode with no tools."""
-        config = Config()
-
         specs = get_tools_to_install(
             mode="explicit",
             tool_names=None,
             preset_name=None,
-            config=config,
+            config=base_config,
         )
 
         assert len(specs) == 0
@@ -416,7 +612,7 @@ class TestGroupByPackageManager:
     """Tests for group_by_package_manager function."""
 
     @patch("cli_audit.bulk.select_package_manager")
-    def test_group_by_package_manager_single(self, mock_select):
+    def test_group_by_package_manager_single(self, mock_select, base_config, base_env):
         """Test grouping with single package manager."""
         mock_select.return_value = ("cargo", "hierarchy")
 
@@ -425,17 +621,14 @@ class TestGroupByPackageManager:
             ToolSpec("fd", "fd", language="rust"),
         ]
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
-        groups = group_by_package_manager(specs, config, env)
+        groups = group_by_package_manager(specs, base_config, base_env)
 
         assert len(groups) == 1
         assert "cargo" in groups
         assert len(groups["cargo"]) == 2
 
     @patch("cli_audit.bulk.select_package_manager")
-    def test_group_by_package_manager_multiple(self, mock_select):
+    def test_group_by_package_manager_multiple(self, mock_select, base_config, base_env):
         """Test grouping with multiple package managers."""
         def select_side_effect(tool_name, language, config, env, verbose=False):
             if language == "rust":
@@ -452,10 +645,7 @@ class TestGroupByPackageManager:
             ToolSpec("mypy", "mypy", language="python"),
         ]
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
-        groups = group_by_package_manager(specs, config, env)
+        groups = group_by_package_manager(specs, base_config, base_env)
 
         assert len(groups) == 2
         assert "cargo" in groups
@@ -463,6 +653,36 @@ class TestGroupByPackageManager:
         assert len(groups["cargo"]) == 1
         assert len(groups["uv"]) == 2
 
+    @patch("cli_audit.bulk.select_package_manager")
+    def test_group_by_package_manager_selects_concurrently(self, mock_select, base_config, base_env):
+        """Test selections overlap while groups keep spec order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def select_side_effect(tool_name, language, config, env, verbose=False):
+            barrier.wait()  # Times out (BrokenBarrierError) if selections run one at a time
+            return ("cargo", "hierarchy")
+
+        mock_select.side_effect = select_side_effect
+        specs = [ToolSpec("ripgrep", "ripgrep", language="rust"), ToolSpec("fd", "fd", language="rust")]
+
+        groups = group_by_package_manager(specs, base_config, base_env)
+
+        assert groups == {"cargo": specs}
+
+    @patch("cli_audit.bulk.select_package_manager")
+    def test_group_by_package_manager_selects_each_pair_once(self, mock_select, base_config, base_env):
+        """Test specs sharing (tool_name, language) reuse one selection."""
+        mock_select.return_value = ("cargo", "hierarchy")
+        specs = [
+            ToolSpec("ripgrep", "ripgrep", language="rust"),
+            ToolSpec("ripgrep", "ripgrep", target_version="14.1.1", language="rust"),
+        ]
+
+        groups = group_by_package_manager(specs, base_config, base_env)
+
+        assert groups == {"cargo": specs}
+        assert mock_select.call_count == 1
+
 
 @skip_on_windows
 class TestGenerateRollbackScript:
@@ -470,8 +690,6 @@ class TestGenerateRollbackScript:
 
     def test_generate_rollback_script_cargo(self):
         """Test rollback script generation for cargo."""
-        from cli_audit.install_plan import InstallStep
-
         step_result = StepResult(
             step=InstallStep("test", ("cargo", "install", "ripgrep")),
             success=True,
@@ -511,8 +729,6 @@ class TestGenerateRollbackScript:
 
     def test_generate_rollback_script_pip(self):
         """Test rollback script generation for pip."""
-        from cli_audit.install_plan import InstallStep
-
         step_result = StepResult(
             step=InstallStep("test", ("pip", "install", "black")),
             success=True,
@@ -543,8 +759,6 @@ class TestGenerateRollbackScript:
 
     def test_generate_rollback_script_multiple(self):
         """Test rollback script with multiple tools."""
-        from cli_audit.install_plan import InstallStep
-
         results = []
         for tool, pm in [("ripgrep", "cargo"), ("black", "pip"), ("fd", "cargo")]:
             step_result = StepResult(
@@ -578,6 +792,74 @@ class TestGenerateRollbackScript:
 
         os.remove(script_path)
 
+    @pytest.mark.parametrize("pm,expected", [
+        ("uv", "uv tool uninstall ruff"),
+        ("pipx", "pipx uninstall ruff"),
+        ("yarn", "yarn global remove ruff"),
+        ("pnpm", "pnpm remove -g ruff"),
+    ])
+    def test_generate_rollback_script_inverts_install_command(self, pm, expected):
+        """Test each package manager gets the uninstall matching how it installed the tool."""
+        result = InstallResult(
+            tool_name="ruff",
+            success=True,
+            installed_version="0.8.0",
+            package_manager_used=pm,
+            steps_completed=(),
+            duration_seconds=1.0,
+            binary_path="/home/user/.local/bin/ruff",
+        )
+
+        script_path = generate_rollback_script([result])
+
+        with open(script_path, "r") as f:
+            assert expected in f.read().splitlines()
+
+        os.remove(script_path)
+
+    def test_generate_rollback_script_layout(self):
+        """Test the script body, skipped entries and executable mode."""
+        results = [
+            InstallResult(
+                tool_name=tool,
+                success=success,
+                installed_version="1.0.0",
+                package_manager_used=pm,
+                steps_completed=(),
+                duration_seconds=1.0,
+                binary_path=binary_path,
+            )
+            for tool, pm, success, binary_path in [
+                ("jq", "apt", True, "/usr/bin/jq"),
+                ("shfmt", "github", True, "/usr/local/bin/shfmt"),
+                ("fd", "cargo", True, None),  # Nothing to remove
+                ("bat", "cargo", False, "/usr/bin/bat"),
+            ]
+        ]
+
+        script_path = generate_rollback_script(results)
+
+        with open(script_path, "r") as f:
+            lines = f.read().split("\n")
+        assert lines[:3] == ["#!/bin/bash", "set -euo pipefail", ""]
+        assert lines[6:] == [
+            "# Rollback: jq",
+            "sudo apt-get remove -y jq",
+            "",
+            "# Rollback: shfmt",
+            "# Manual removal required for shfmt (github)",
+            "",
+            "",
+        ]
+        assert os.access(script_path, os.X_OK)
+
+        # Every call gets its own file, even within the same second
+        second_path = generate_rollback_script(results)
+        assert second_path != script_path
+
+        os.remove(script_path)
+        os.remove(second_path)
+
 
 class TestExecuteRollback:
     """Tests for execute_rollback function."""
@@ -624,10 +906,8 @@ class TestBulkInstall:
     @skip_on_windows
     @patch("cli_audit.bulk.install_tool")
     @patch("cli_audit.bulk.get_missing_tools")
-    def test_bulk_install_explicit_success(self, mock_get_missing, mock_install):
+    def test_bulk_install_explicit_success(self, mock_get_missing, mock_install, base_config, base_env):
         """Test bulk install in explicit mode with success."""
-        from cli_audit.install_plan import InstallStep
-
         # Mock install_tool to return success
         step_result = StepResult(
             step=InstallStep("test", ("echo", "test")),
@@ -649,14 +929,11 @@ class TestBulkInstall:
             binary_path="/usr/bin/rg",
         )
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=["ripgrep"],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
             max_workers=1,
         )
 
@@ -666,10 +943,8 @@ class TestBulkInstall:
         assert result.successes[0].tool_name == "ripgrep"
 
     @patch("cli_audit.bulk.install_tool")
-    def test_bulk_install_explicit_failure(self, mock_install):
+    def test_bulk_install_explicit_failure(self, mock_install, base_config, base_env):
         """Test bulk install with failure."""
-        from cli_audit.install_plan import InstallStep
-
         step_result = StepResult(
             step=InstallStep("test", ("echo", "test")),
             success=False,
@@ -690,30 +965,24 @@ class TestBulkInstall:
             error_message="Installation failed",
         )
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=["ripgrep"],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
             max_workers=1,
         )
 
         assert len(result.failures) == 1
         assert len(result.successes) == 0
 
-    def test_bulk_install_no_tools(self):
+    def test_bulk_install_no_tools(self, base_config, base_env):
         """Test bulk install with no tools."""
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=[],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
         )
 
         assert result.tools_attempted == ()
@@ -721,16 +990,13 @@ class TestBulkInstall:
         assert len(result.failures) == 0
 
     @patch("cli_audit.bulk.install_tool")
-    def test_bulk_install_dry_run(self, mock_install):
+    def test_bulk_install_dry_run(self, mock_install, base_config, base_env):
         """Test bulk install in dry-run mode."""
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=["ripgrep", "black"],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
             dry_run=True,
         )
 
@@ -739,12 +1005,25 @@ class TestBulkInstall:
         assert result.tools_attempted == ("ripgrep", "black")
         assert len(result.successes) == 0
 
+    @patch("cli_audit.bulk.detect_environment")
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_dry_run_skips_environment_detection(self, mock_install, mock_detect, base_config):
+        """Test dry-run plans without probing the environment."""
+        result = bulk_install(
+            mode="explicit",
+            tool_names=["ripgrep"],
+            config=base_config,
+            dry_run=True,
+        )
+
+        assert result.tools_attempted == ("ripgrep",)
+        assert mock_detect.call_count == 0
+        assert mock_install.call_count == 0
+
     @skip_on_windows
     @patch("cli_audit.bulk.install_tool")
-    def test_bulk_install_fail_fast(self, mock_install):
+    def test_bulk_install_fail_fast(self, mock_install, base_env):
         """Test bulk install with fail-fast mode with dependencies."""
-        from cli_audit.install_plan import InstallStep
-
         # Mock install_tool - first succeeds, second fails
         call_count = 0
 
@@ -782,7 +1061,6 @@ class TestBulkInstall:
             "tool2": ToolConfig(),
             "tool3": ToolConfig(),
         })
-        env = Environment(mode="workstation", confidence=1.0)
 
         # We need to test the actual bulk_install, but with dependency resolution
         # Since bulk_install generates specs internally, let's just verify fail_fast stops execution
@@ -790,7 +1068,7 @@ class TestBulkInstall:
             mode="explicit",
             tool_names=["tool1", "tool2"],
             config=config,
-            env=env,
+            env=base_env,
             fail_fast=True,
             max_workers=1,
         )
@@ -802,10 +1080,113 @@ class TestBulkInstall:
 
     @skip_on_windows
     @patch("cli_audit.bulk.install_tool")
-    def test_bulk_install_parallel(self, mock_install):
-        """Test parallel bulk install."""
-        from cli_audit.install_plan import InstallStep
+    def test_bulk_install_flushes_progress_batches(self, mock_install, base_config, base_env):
+        """Test bulk_install delivers every pending batched progress event before returning."""
+        mock_install.side_effect = lambda **kwargs: InstallResult(
+            tool_name=kwargs["tool_name"],
+            success=True,
+            installed_version="1.0.0",
+            package_manager_used="cargo",
+            steps_completed=(),
+            duration_seconds=1.0,
+        )
+        tracker = ProgressTracker(callback_min_interval_s=3600, callback_batch_size=1000)
+        batches = []
+        tracker.register_batch_callback(batches.append)
+
+        bulk_install(
+            mode="explicit",
+            tool_names=["tool1", "tool2"],
+            config=base_config,
+            env=base_env,
+            max_workers=1,
+            progress_tracker=tracker,
+        )
+
+        events = [event for batch in batches for event in batch]
+        assert len(batches) == 1
+        assert [event[1] for event in events if event[0] == "tool1"][-1] == "success"
+
+    @skip_on_windows
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_fail_fast_stops_submitting(self, mock_install, base_config, base_env):
+        """Test fail-fast submits nothing new after a failure and skips the rest of the level."""
+        failed = threading.Event()
+        tracker = ProgressTracker()
+        tracker.register_callback(lambda tool, status, message: status == "failed" and failed.set())
+
+        def install_side_effect(*args, **kwargs):
+            tool_name = kwargs["tool_name"]
+            if tool_name != "tool1":
+                failed.wait(timeout=5)  # Still running when tool1's failure is handled
+            return InstallResult(
+                tool_name=tool_name,
+                success=tool_name != "tool1",
+                installed_version=None if tool_name == "tool1" else "1.0.0",
+                package_manager_used="cargo",
+                steps_completed=(),
+                duration_seconds=1.0,
+                error_message="Installation failed" if tool_name == "tool1" else None,
+            )
+
+        mock_install.side_effect = install_side_effect
+
+        result = bulk_install(
+            mode="explicit",
+            tool_names=["tool1", "tool2", "tool3", "tool4"],
+            config=base_config,
+            env=base_env,
+            fail_fast=True,
+            max_workers=2,
+            progress_tracker=tracker,
+        )
+
+        # tool1 and tool2 were in flight; tool2 is still collected, later tools never start
+        assert mock_install.call_count == 2
+        assert [r.tool_name for r in result.failures] == ["tool1"]
+        assert [r.tool_name for r in result.successes] == ["tool2"]
+        assert result.skipped == ("tool3", "tool4")
+
+    @skip_on_windows
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_fail_fast_keeps_pool_full(self, mock_install, base_config, base_env):
+        """Test fail-fast starts the next tool as soon as one finishes, not per batch."""
+        tool3_started = threading.Event()
+
+        def install_side_effect(*args, **kwargs):
+            tool_name = kwargs["tool_name"]
+            if tool_name == "tool1":
+                # Slow install: tool3 must start while it is still running
+                assert tool3_started.wait(timeout=5)
+            elif tool_name == "tool3":
+                tool3_started.set()
+            return InstallResult(
+                tool_name=tool_name,
+                success=True,
+                installed_version="1.0.0",
+                package_manager_used="cargo",
+                steps_completed=(),
+                duration_seconds=1.0,
+            )
 
+        mock_install.side_effect = install_side_effect
+
+        result = bulk_install(
+            mode="explicit",
+            tool_names=["tool1", "tool2", "tool3"],
+            config=base_config,
+            env=base_env,
+            fail_fast=True,
+            max_workers=2,
+        )
+
+        assert len(result.successes) == 3
+        assert result.failures == ()
+
+    @skip_on_windows
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_parallel(self, mock_install, base_config, base_env):
+        """Test parallel bulk install."""
         install_count = 0
 
         def install_side_effect(*args, **kwargs):
@@ -834,27 +1215,123 @@ class TestBulkInstall:
 
         mock_install.side_effect = install_side_effect
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=["tool1", "tool2", "tool3", "tool4"],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
             max_workers=4,
         )
 
         assert len(result.successes) == 4
         assert install_count == 4
 
+    @patch("cli_audit.bulk.os.cpu_count", return_value=8)
+    def test_default_workers(self, mock_cpu_count):
+        """Test default worker count for download-bound vs. compile-bound installs."""
+        from cli_audit.bulk import _default_workers
+
+        assert _default_workers([ToolSpec("black", "black", language="python")]) == 32
+        assert _default_workers([ToolSpec("black", "black"), ToolSpec("rg", "ripgrep", language="rust")]) == 7
+
+        mock_cpu_count.return_value = None
+        assert _default_workers([ToolSpec("black", "black")]) == 4
+
+    @skip_on_windows
+    @patch("cli_audit.bulk.os.cpu_count", return_value=8)
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_default_workers_capped_by_preferences(self, mock_install, mock_cpu_count, base_env):
+        """Test preferences.max_workers caps the default worker count."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_install.return_value = InstallResult(
+            tool_name="ripgrep",
+            success=True,
+            installed_version="1.0.0",
+            package_manager_used="cargo",
+            steps_completed=(),
+            duration_seconds=1.0,
+        )
+
+        config = Config(preferences=Preferences(max_workers=3))
+
+        with patch("cli_audit.bulk.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            bulk_install(mode="explicit", tool_names=["ripgrep"], config=config, env=base_env)
+
+        assert mock_pool.call_args.kwargs["max_workers"] == 3
+
+    @skip_on_windows
+    @patch("cli_audit.bulk.install_tool")
+    @patch("cli_audit.bulk.get_tools_to_install")
+    def test_bulk_install_levels_share_one_pool(self, mock_get_tools, mock_install, base_config, base_env):
+        """Test dependency levels run in order on a single thread pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_get_tools.return_value = [
+            ToolSpec("lib", "lib"),
+            ToolSpec("app", "app", dependencies=("lib",)),
+        ]
+        installed = []
+
+        def install_side_effect(*args, **kwargs):
+            installed.append(kwargs["tool_name"])
+            return InstallResult(
+                tool_name=kwargs["tool_name"],
+                success=True,
+                installed_version="1.0.0",
+                package_manager_used="cargo",
+                steps_completed=(),
+                duration_seconds=1.0,
+            )
+
+        mock_install.side_effect = install_side_effect
+
+        with patch("cli_audit.bulk.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            result = bulk_install(
+                mode="explicit",
+                tool_names=["lib", "app"],
+                config=base_config,
+                env=base_env,
+                max_workers=2,
+            )
+
+        assert mock_pool.call_count == 1
+        assert installed == ["lib", "app"]
+        assert len(result.successes) == 2
+
+    @pytest.mark.parametrize("binary_path,generate_pref", [
+        (None, True),  # Nothing installed a binary, nothing to roll back
+        ("/usr/bin/ripgrep", False),  # Disabled in preferences
+    ])
+    @patch("cli_audit.bulk.generate_rollback_script")
+    @patch("cli_audit.bulk.install_tool")
+    def test_bulk_install_skips_rollback_script(self, mock_install, mock_generate, binary_path, generate_pref, base_env):
+        """Test no rollback script is written when there is nothing to roll back or it is disabled."""
+        from cli_audit.config import BulkPreferences
+
+        mock_install.return_value = InstallResult(
+            tool_name="ripgrep",
+            success=True,
+            installed_version="1.0.0",
+            package_manager_used="cargo",
+            steps_completed=(),
+            duration_seconds=1.0,
+            binary_path=binary_path,
+        )
+
+        config = Config(preferences=Preferences(bulk=BulkPreferences(generate_rollback_script=generate_pref)))
+
+        result = bulk_install(mode="explicit", tool_names=["ripgrep"], config=config, env=base_env, max_workers=1)
+
+        assert len(result.successes) == 1
+        assert result.rollback_script is None
+        mock_generate.assert_not_called()
+
     @skip_on_windows
     @patch("cli_audit.bulk.install_tool")
     @patch("cli_audit.bulk.execute_rollback")
-    def test_bulk_install_atomic_rollback(self, mock_rollback, mock_install):
+    def test_bulk_install_atomic_rollback(self, mock_rollback, mock_install, base_config, base_env):
         """Test atomic rollback on failure."""
-        from cli_audit.install_plan import InstallStep
-
         # First succeeds, second fails
         call_count = 0
 
@@ -885,14 +1362,11 @@ class TestBulkInstall:
         mock_install.side_effect = install_side_effect
         mock_rollback.return_value = True
 
-        config = Config()
-        env = Environment(mode="workstation", confidence=1.0)
-
         result = bulk_install(
             mode="explicit",
             tool_names=["tool1", "tool2"],
-            config=config,
-            env=env,
+            config=base_config,
+            env=base_env,
             atomic=True,
             max_workers=1,
         )
@@ -8,37 +8,62 @@ Covers:
 - GitHub rate limit: authentication helpers, gh CLI integration
 """
 
-import json
-import os
-from pathlib import Path
+import re
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Get the project root directory
-PROJECT_ROOT = Path(__file__).parent.parent
+import audit
+from cli_audit.collectors import get_gh_cli_token, get_github_rate_limit, get_github_rate_limit_help
 
+from .paths import CATALOG_DIR
 
+# Catalog entry names, listed at collection time so each file gets its own test ids
+CATALOG_NAMES = sorted(path.stem for path in CATALOG_DIR.glob("*.json"))
+
+# Case-insensitive probes, so script/notes text is scanned without a lower() copy
+_NATIVE_INSTALLER_RE = re.compile(r"native|curl", re.IGNORECASE)
+_BREW_RE = re.compile(r"brew", re.IGNORECASE)  # Also matches "Homebrew"
+_NODE_RE = re.compile(r"node", re.IGNORECASE)  # Also matches "Node.js"
+
+# Windows has no POSIX executable bit, so st_mode never carries 0o111 for .sh files
+skip_on_windows = pytest.mark.skipif(
+    sys.platform == "win32", reason="Executable bit is POSIX-only"
+)
+
+# Required field values, compared as one dict-items subset check per entry.
+# The subset result is a plain bool, so failures name the fields via _field_mismatches.
+_PHP_REQUIRED = {"name": "php", "category": "php", "install_method": "package_manager", "binary_name": "php"}
+_CLAUDE_REQUIRED = {  # Required fields for dedicated_script tools
+    "name": "claude",
+    "install_method": "dedicated_script",
+    "script": "install_claude.sh",
+    "binary_name": "claude",
+    "github_repo": "anthropics/claude-code",
+}
+
+
+def _field_mismatches(expected, data):
+    """Map each required field whose value differs in data to (expected, actual)."""
+    return {key: (value, data.get(key)) for key, value in expected.items() if data.get(key) != value}
+
+
+@pytest.mark.xdist_group(name="catalog")
 class TestClaudeVersionDetection:
     """Tests for Claude Code version detection fix."""
 
-    def test_claude_catalog_has_version_command(self):
+    def test_claude_catalog_has_version_command(self, catalog_data):
         """Test that claude.json has a version_command field."""
-        catalog_path = PROJECT_ROOT / "catalog" / "claude.json"
-        assert catalog_path.exists(), "claude.json catalog file should exist"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        assert "claude" in catalog_data, "claude.json catalog file should exist"
+        data = catalog_data["claude"]
 
         assert "version_command" in data, "claude.json should have version_command field"
         assert data["version_command"], "version_command should not be empty"
 
-    def test_claude_catalog_version_command_format(self):
+    def test_claude_catalog_version_command_format(self, catalog_data):
         """Test that claude.json version_command runs claude --version."""
-        catalog_path = PROJECT_ROOT / "catalog" / "claude.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["claude"]
 
         version_cmd = data.get("version_command", "")
         # Should run claude --version directly for accurate detection
@@ -46,128 +71,87 @@ class TestClaudeVersionDetection:
         assert "claude" in version_cmd, "version_command should run claude binary"
         assert "--version" in version_cmd, "version_command should use --version flag"
 
-    def test_claude_catalog_structure(self):
+    def test_claude_catalog_structure(self, catalog_data):
         """Test that claude.json has valid catalog structure."""
-        catalog_path = PROJECT_ROOT / "catalog" / "claude.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["claude"]
 
-        # Required fields for dedicated_script tools
-        assert data.get("name") == "claude"
-        assert data.get("install_method") == "dedicated_script"
-        assert data.get("script") == "install_claude.sh"
-        assert data.get("binary_name") == "claude"
-        assert data.get("github_repo") == "anthropics/claude-code"
+        assert _CLAUDE_REQUIRED.items() <= data.items(), _field_mismatches(_CLAUDE_REQUIRED, data)
 
-    def test_claude_catalog_has_notes_about_install_methods(self):
+    def test_claude_catalog_has_notes_about_install_methods(self, catalog_data):
         """Test that claude.json documents installation methods."""
-        catalog_path = PROJECT_ROOT / "catalog" / "claude.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["claude"]
 
         notes = data.get("notes", "")
         # Should mention native installer
-        assert "native" in notes.lower() or "curl" in notes.lower()
+        assert _NATIVE_INSTALLER_RE.search(notes)
         # Should mention Node.js version limitation
-        assert "Node.js" in notes or "node" in notes.lower()
+        assert _NODE_RE.search(notes)
 
 
+@pytest.mark.xdist_group(name="scripts")
 class TestClaudeInstallScript:
     """Tests for Claude Code install script."""
 
-    def test_install_script_exists(self):
+    def test_install_script_exists(self, script_texts):
         """Test that install_claude.sh exists."""
-        script_path = PROJECT_ROOT / "scripts" / "install_claude.sh"
-        assert script_path.exists(), "install_claude.sh should exist"
+        assert "install_claude.sh" in script_texts, "install_claude.sh should exist"
 
-    def test_install_script_is_executable(self):
+    @skip_on_windows
+    def test_install_script_is_executable(self, script_stats):
         """Test that install_claude.sh is executable."""
-        script_path = PROJECT_ROOT / "scripts" / "install_claude.sh"
-        assert os.access(script_path, os.X_OK), "install_claude.sh should be executable"
+        assert script_stats["install_claude.sh"].st_mode & 0o111, "install_claude.sh should be executable"
 
-    def test_install_script_uses_native_installer(self):
+    def test_install_script_uses_native_installer(self, script_texts):
         """Test that install_claude.sh uses native installer as primary method."""
-        script_path = PROJECT_ROOT / "scripts" / "install_claude.sh"
-        content = script_path.read_text()
+        content = script_texts["install_claude.sh"]
 
         # Should use official native installer
         assert "claude.ai/install.sh" in content
         # Should have fallbacks
-        assert "homebrew" in content.lower() or "brew" in content
+        assert _BREW_RE.search(content)
         assert "npm" in content
 
-    def test_install_script_handles_node_version(self):
+    def test_install_script_handles_node_version(self, script_texts):
         """Test that install_claude.sh checks Node.js version for npm fallback."""
-        script_path = PROJECT_ROOT / "scripts" / "install_claude.sh"
-        content = script_path.read_text()
+        content = script_texts["install_claude.sh"]
 
         # Should check Node.js version before npm install
-        assert "node" in content.lower()
+        assert _NODE_RE.search(content)
         assert "25" in content  # v25+ warning
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestPHPCatalog:
     """Tests for PHP catalog entry."""
 
-    def test_php_catalog_exists(self):
+    def test_php_catalog_exists(self, catalog_data):
         """Test that php.json catalog file exists."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-        assert catalog_path.exists(), "php.json catalog file should exist"
-
-    def test_php_catalog_valid_json(self):
-        """Test that php.json is valid JSON."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)  # Should not raise
+        assert "php" in catalog_data, "php.json catalog file should exist"
 
-        assert isinstance(data, dict)
-
-    def test_php_catalog_required_fields(self):
+    def test_php_catalog_required_fields(self, catalog_data):
         """Test that php.json has all required fields."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["php"]
 
-        # Required fields
-        assert data.get("name") == "php"
-        assert data.get("category") == "php"
-        assert data.get("install_method") == "package_manager"
-        assert data.get("binary_name") == "php"
+        assert _PHP_REQUIRED.items() <= data.items(), _field_mismatches(_PHP_REQUIRED, data)
 
-    def test_php_catalog_has_ppa(self):
+    def test_php_catalog_has_ppa(self, catalog_data):
         """Test that php.json has PPA for latest PHP on Ubuntu."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["php"]
 
         assert "ppa" in data, "php.json should have PPA field"
         assert "ondrej" in data["ppa"], "PHP PPA should be ondrej/php"
 
-    def test_php_catalog_has_packages(self):
-        """Test that php.json has package definitions for package managers."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+    @pytest.mark.parametrize("manager", ["apt", "brew"])
+    def test_php_catalog_has_packages(self, catalog_data, manager):
+        """Test that php.json has package definitions for common package managers."""
+        data = catalog_data["php"]
 
         assert "packages" in data, "php.json should have packages field"
-        packages = data["packages"]
-
-        # Should support common package managers
-        assert "apt" in packages, "Should have apt package"
-        assert "brew" in packages, "Should have brew package"
+        assert manager in data["packages"], f"Should have {manager} package"
 
-    def test_php_catalog_guide_order(self):
+    def test_php_catalog_guide_order(self, catalog_data):
         """Test that PHP has guide section with proper order."""
-        catalog_path = PROJECT_ROOT / "catalog" / "php.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["php"]
 
         assert "guide" in data, "php.json should have guide section"
         guide = data["guide"]
@@ -176,28 +160,21 @@ class TestPHPCatalog:
         assert guide["order"] < 260, "PHP should have lower order than Composer"
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestComposerRequiresPHP:
     """Tests for Composer's PHP dependency."""
 
-    def test_composer_has_requires_field(self):
+    def test_composer_has_requires_field(self, catalog_data):
         """Test that composer.json has requires field with PHP."""
-        catalog_path = PROJECT_ROOT / "catalog" / "composer.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+        data = catalog_data["composer"]
 
         assert "requires" in data, "composer.json should have requires field"
         assert "php" in data["requires"], "Composer should require PHP"
 
-    def test_composer_guide_order_after_php(self):
+    def test_composer_guide_order_after_php(self, catalog_data):
         """Test that Composer's guide order is after PHP."""
-        php_path = PROJECT_ROOT / "catalog" / "php.json"
-        composer_path = PROJECT_ROOT / "catalog" / "composer.json"
-
-        with open(php_path) as f:
-            php_data = json.load(f)
-        with open(composer_path) as f:
-            composer_data = json.load(f)
+        php_data = catalog_data["php"]
+        composer_data = catalog_data["composer"]
 
         php_order = php_data.get("guide", {}).get("order", 0)
         composer_order = composer_data.get("guide", {}).get("order", 999)
@@ -205,34 +182,31 @@ class TestComposerRequiresPHP:
         assert composer_order > php_order, "Composer should be installed after PHP"
 
 
+@pytest.mark.xdist_group(name="scripts")
 class TestInstallComposerPHPCheck:
     """Tests for install_composer.sh PHP dependency check."""
 
-    def test_install_composer_checks_php(self):
+    def test_install_composer_checks_php(self, script_texts):
         """Test that install_composer.sh checks for PHP."""
-        script_path = PROJECT_ROOT / "scripts" / "install_composer.sh"
-        assert script_path.exists(), "install_composer.sh should exist"
+        assert "install_composer.sh" in script_texts, "install_composer.sh should exist"
 
-        content = script_path.read_text()
+        content = script_texts["install_composer.sh"]
 
         # Should check for PHP
         assert "command -v php" in content, "Script should check for PHP"
         assert "Error: PHP is required" in content or "PHP is required" in content, "Script should mention PHP requirement"
 
 
+@pytest.mark.xdist_group(name="collectors")
 class TestGitHubRateLimitHelpers:
     """Tests for GitHub rate limit helper functions."""
 
     def test_get_github_rate_limit_help_exists(self):
         """Test that get_github_rate_limit_help function exists."""
-        from cli_audit.collectors import get_github_rate_limit_help
-
         assert callable(get_github_rate_limit_help)
 
     def test_get_github_rate_limit_help_content(self):
         """Test that help message contains useful instructions."""
-        from cli_audit.collectors import get_github_rate_limit_help
-
         help_text = get_github_rate_limit_help()
 
         # Should mention GITHUB_TOKEN
@@ -246,42 +220,34 @@ class TestGitHubRateLimitHelpers:
 
     def test_get_gh_cli_token_exists(self):
         """Test that get_gh_cli_token function exists."""
-        from cli_audit.collectors import get_gh_cli_token
-
         assert callable(get_gh_cli_token)
 
-    @patch("shutil.which")
-    def test_get_gh_cli_token_no_gh(self, mock_which):
+    @patch("cli_audit.collectors.shutil")
+    def test_get_gh_cli_token_no_gh(self, mock_shutil):
         """Test get_gh_cli_token returns None when gh not installed."""
-        from cli_audit.collectors import get_gh_cli_token
-
-        mock_which.return_value = None
+        mock_shutil.which.return_value = None
         result = get_gh_cli_token()
         assert result is None
 
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    def test_get_gh_cli_token_not_authenticated(self, mock_which, mock_run):
+    @patch("cli_audit.collectors.subprocess")
+    @patch("cli_audit.collectors.shutil")
+    def test_get_gh_cli_token_not_authenticated(self, mock_shutil, mock_subprocess):
         """Test get_gh_cli_token returns None when gh not authenticated."""
-        from cli_audit.collectors import get_gh_cli_token
-
-        mock_which.return_value = "/usr/bin/gh"
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_shutil.which.return_value = "/usr/bin/gh"
+        mock_subprocess.run.return_value = MagicMock(returncode=1)
 
         result = get_gh_cli_token()
         assert result is None
 
-    @patch("subprocess.run")
-    @patch("shutil.which")
-    def test_get_gh_cli_token_authenticated(self, mock_which, mock_run):
+    @patch("cli_audit.collectors.subprocess")
+    @patch("cli_audit.collectors.shutil")
+    def test_get_gh_cli_token_authenticated(self, mock_shutil, mock_subprocess):
         """Test get_gh_cli_token returns token when gh is authenticated."""
-        from cli_audit.collectors import get_gh_cli_token
-
-        mock_which.return_value = "/usr/bin/gh"
+        mock_shutil.which.return_value = "/usr/bin/gh"
 
         # First call: gh auth status (success)
         # Second call: gh auth token (returns token)
-        mock_run.side_effect = [
+        mock_subprocess.run.side_effect = [
             MagicMock(returncode=0),  # auth status
             MagicMock(returncode=0, stdout="ghp_testtoken123\n"),  # auth token
         ]
@@ -289,10 +255,9 @@ class TestGitHubRateLimitHelpers:
         result = get_gh_cli_token()
         assert result == "ghp_testtoken123"
 
+    @pytest.mark.network
     def test_get_github_rate_limit_returns_authenticated_field(self):
         """Test that get_github_rate_limit returns authenticated field."""
-        from cli_audit.collectors import get_github_rate_limit
-
         # This is an integration test - it makes a real API call
         # We just check the structure is correct
         result = get_github_rate_limit()
@@ -302,59 +267,63 @@ class TestGitHubRateLimitHelpers:
             assert "limit" in result
             assert "remaining" in result
 
+    @patch("cli_audit.collectors.http_get")
+    def test_get_github_rate_limit_parses_core_resource(self, mock_http_get, monkeypatch):
+        """Test get_github_rate_limit maps the API's core resource without network access."""
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_testtoken123")
+        mock_http_get.return_value = (
+            b'{"resources": {"core": {"limit": 5000, "remaining": 4990, "used": 10, "reset": 1700000000}}}'
+        )
+
+        result = get_github_rate_limit()
 
+        assert result == {
+            "limit": 5000,
+            "remaining": 4990,
+            "used": 10,
+            "reset": 1700000000,
+            "authenticated": True,
+            "token_source": "GITHUB_TOKEN",
+        }
+        assert mock_http_get.call_args.kwargs["headers"]["Authorization"] == "token ghp_testtoken123"
+
+
+@pytest.mark.xdist_group(name="collectors")
 class TestGitHubRateLimitDisplay:
     """Tests for rate limit display in audit.py."""
 
     def test_audit_imports_help_function(self):
         """Test that audit.py imports get_github_rate_limit_help."""
-        import audit
-
         assert hasattr(audit, "get_github_rate_limit_help") or "get_github_rate_limit_help" in dir(audit)
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestCatalogIntegrity:
     """Tests for overall catalog integrity."""
 
-    def test_all_catalog_files_valid_json(self):
+    @pytest.mark.parametrize("catalog_name", CATALOG_NAMES)
+    def test_all_catalog_files_valid_json(self, catalog_data, catalog_name):
         """Test that all catalog files are valid JSON."""
-        catalog_dir = PROJECT_ROOT / "catalog"
+        # Invalid JSON already fails in the catalog_data fixture, naming the file
+        assert isinstance(catalog_data[catalog_name], dict), f"{catalog_name}.json should contain a dict"
 
-        for json_file in catalog_dir.glob("*.json"):
-            with open(json_file) as f:
-                try:
-                    data = json.load(f)
-                    assert isinstance(data, dict), f"{json_file.name} should contain a dict"
-                except json.JSONDecodeError as e:
-                    pytest.fail(f"{json_file.name} is not valid JSON: {e}")
-
-    def test_all_catalog_files_have_name(self):
+    @pytest.mark.parametrize("catalog_name", CATALOG_NAMES)
+    def test_all_catalog_files_have_name(self, catalog_data, catalog_name):
         """Test that all catalog files have a name field."""
-        catalog_dir = PROJECT_ROOT / "catalog"
-
-        for json_file in catalog_dir.glob("*.json"):
-            with open(json_file) as f:
-                data = json.load(f)
-            assert "name" in data, f"{json_file.name} should have 'name' field"
+        assert "name" in catalog_data[catalog_name], f"{catalog_name}.json should have 'name' field"
 
-    def test_all_catalog_files_have_install_method(self):
+    @pytest.mark.parametrize("catalog_name", CATALOG_NAMES)
+    def test_all_catalog_files_have_install_method(self, catalog_data, catalog_name):
         """Test that all catalog files have an install_method field."""
-        catalog_dir = PROJECT_ROOT / "catalog"
-
-        for json_file in catalog_dir.glob("*.json"):
-            with open(json_file) as f:
-                data = json.load(f)
-            assert "install_method" in data, f"{json_file.name} should have 'install_method' field"
+        assert "install_method" in catalog_data[catalog_name], f"{catalog_name}.json should have 'install_method' field"
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestBubblewrapCatalog:
     """Tests for the Bubblewrap catalog entry."""
 
-    def test_bwrap_catalog_uses_distribution_package_name(self):
-        catalog_path = PROJECT_ROOT / "catalog" / "bwrap.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+    def test_bwrap_catalog_uses_distribution_package_name(self, catalog_data):
+        data = catalog_data["bwrap"]
 
         assert data["name"] == "bwrap"
         assert data["binary_name"] == "bwrap"
@@ -363,14 +332,12 @@ class TestBubblewrapCatalog:
         assert data["github_repo"] == "containers/bubblewrap"
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestByobuCatalog:
     """Tests for the upstream Byobu catalog entry."""
 
-    def test_byobu_catalog_uses_dedicated_source_installer(self):
-        catalog_path = PROJECT_ROOT / "catalog" / "byobu.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+    def test_byobu_catalog_uses_dedicated_source_installer(self, catalog_data):
+        data = catalog_data["byobu"]
 
         assert data["name"] == "byobu"
         assert data["install_method"] == "dedicated_script"
@@ -381,16 +348,18 @@ class TestByobuCatalog:
         assert '"VERSION"' in data["version_command"]
 
 
+@pytest.mark.xdist_group(name="scripts")
 class TestByobuInstallScript:
     """Tests for the dedicated upstream Byobu installer."""
 
-    def test_byobu_installer_is_executable_and_filters_stable_tags(self):
-        script_path = PROJECT_ROOT / "scripts" / "install_byobu.sh"
+    @skip_on_windows
+    def test_byobu_installer_is_executable(self, script_stats):
+        assert script_stats["install_byobu.sh"].st_mode & 0o111
 
-        assert script_path.exists()
-        assert os.access(script_path, os.X_OK)
+    def test_byobu_installer_filters_stable_tags(self, script_texts):
+        assert "install_byobu.sh" in script_texts
 
-        content = script_path.read_text()
+        content = script_texts["install_byobu.sh"]
         assert "^[0-9]+([.][0-9]+)+$" in content
         assert "archive/refs/tags/${version}.tar.gz" in content
         assert './configure --prefix="$INSTALL_PREFIX"' in content
@@ -398,14 +367,12 @@ class TestByobuInstallScript:
         assert "uninstall)" in content
 
 
+@pytest.mark.xdist_group(name="catalog")
 class TestTrustmuxCatalog:
     """Tests for the upstream Trustmux PyPI catalog entry."""
 
-    def test_trustmux_catalog_uses_uv_tool(self):
-        catalog_path = PROJECT_ROOT / "catalog" / "trustmux.json"
-
-        with open(catalog_path) as f:
-            data = json.load(f)
+    def test_trustmux_catalog_uses_uv_tool(self, catalog_data):
+        data = catalog_data["trustmux"]
 
         assert data["name"] == "trustmux"
         assert data["install_method"] == "uv_tool"
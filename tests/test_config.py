@@ -19,6 +19,7 @@ from cli_audit.config import (
     validate_config,
     _load_yaml,
     _load_json,
+    _loaded_configs,
 )
 
 
@@ -31,6 +32,25 @@ CONFIG_INVALID_ENV = str(FIXTURES_DIR / "config_invalid_env.yml")
 CONFIG_PROJECT = str(FIXTURES_DIR / "config_project.yml")
 CONFIG_USER = str(FIXTURES_DIR / "config_user.yml")
 
+# Fixture file names, listed once at import instead of one stat() per skipif
+_FIXTURE_NAMES = frozenset(os.listdir(FIXTURES_DIR)) if FIXTURES_DIR.is_dir() else frozenset()
+
+
+def _requires_fixtures(*paths):
+    """Skip the test unless every given fixture file is present."""
+    return pytest.mark.skipif(
+        not all(os.path.basename(path) in _FIXTURE_NAMES for path in paths),
+        reason="Test fixtures not found",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_loaded_configs():
+    """Start every test with an empty load_config_file memo so patched loaders take effect."""
+    _loaded_configs.clear()
+    yield
+    _loaded_configs.clear()
+
 
 class TestToolConfig:
     """Tests for ToolConfig dataclass."""
@@ -71,6 +91,12 @@ class TestToolConfig:
         with pytest.raises(AttributeError):
             config.version = "2.0.0"  # Should fail (frozen)
 
+    def test_tool_config_has_no_instance_dict(self):
+        """Test ToolConfig uses __slots__ (no per-instance __dict__)."""
+        config = ToolConfig(version="1.0.0")
+        assert not hasattr(config, "__dict__")
+        assert config == ToolConfig(version="1.0.0")
+
 
 class TestPreferences:
     """Tests for Preferences dataclass."""
@@ -102,35 +128,21 @@ class TestPreferences:
         assert prefs.max_workers == 8
         assert prefs.package_managers == {"python": ["uv", "pip"]}
 
-    def test_preferences_invalid_reconciliation(self):
-        """Test that invalid reconciliation raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid reconciliation strategy"):
-            Preferences(reconciliation="invalid")
-
-    def test_preferences_invalid_breaking_changes(self):
-        """Test that invalid breaking_changes raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid breaking_changes setting"):
-            Preferences(breaking_changes="invalid")
-
-    def test_preferences_invalid_timeout_too_low(self):
-        """Test that timeout < 1 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid timeout_seconds"):
-            Preferences(timeout_seconds=0)
-
-    def test_preferences_invalid_timeout_too_high(self):
-        """Test that timeout > 60 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid timeout_seconds"):
-            Preferences(timeout_seconds=61)
-
-    def test_preferences_invalid_max_workers_too_low(self):
-        """Test that max_workers < 1 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid max_workers"):
-            Preferences(max_workers=0)
-
-    def test_preferences_invalid_max_workers_too_high(self):
-        """Test that max_workers > 32 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid max_workers"):
-            Preferences(max_workers=33)
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"reconciliation": "invalid"}, "Invalid reconciliation strategy"),
+        ({"breaking_changes": "invalid"}, "Invalid breaking_changes setting"),
+        ({"timeout_seconds": 0}, "Invalid timeout_seconds"),
+        ({"timeout_seconds": 61}, "Invalid timeout_seconds"),
+        ({"max_workers": 0}, "Invalid max_workers"),
+        ({"max_workers": 33}, "Invalid max_workers"),
+    ], ids=[
+        "reconciliation", "breaking_changes", "timeout_too_low", "timeout_too_high",
+        "max_workers_too_low", "max_workers_too_high",
+    ])
+    def test_preferences_invalid_values(self, kwargs, match):
+        """Test that out-of-range or unknown preference values raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            Preferences(**kwargs)
 
     def test_preferences_from_dict(self):
         """Test creating Preferences from dictionary."""
@@ -187,6 +199,16 @@ class TestConfig:
         with pytest.raises(ValueError, match="Invalid environment_mode"):
             Config(environment_mode="invalid")
 
+    @pytest.mark.parametrize("mode", ["auto", "ci", "server", "workstation"])
+    def test_config_valid_environment_modes(self, mode):
+        """Test that every documented environment_mode is accepted."""
+        assert Config(environment_mode=mode).environment_mode == mode
+
+    def test_config_invalid_environment_mode_lists_choices(self):
+        """Test that the environment_mode error lists the accepted modes in order."""
+        with pytest.raises(ValueError, match="Must be one of: auto, ci, server, workstation"):
+            Config(environment_mode="laptop")
+
     def test_config_from_dict(self):
         """Test creating Config from dictionary."""
         data = {
@@ -224,12 +246,32 @@ class TestConfig:
         assert tool_config.version == "latest"  # Default
         assert tool_config.method is None
 
+    def test_config_unconfigured_tools_share_default(self):
+        """Test that unconfigured tools reuse one frozen default ToolConfig."""
+        config = Config()
+        assert config.get_tool_config("ripgrep") is config.get_tool_config("fd")
+        assert config.get_tool_config("ripgrep") == ToolConfig()
+
+    def test_config_default_preferences_not_shared(self):
+        """Test that each Config gets its own mutable package_managers map."""
+        config = Config()
+        config.preferences.package_managers["python"] = ["uv"]
+        assert Config().preferences.package_managers == {}
+        assert Preferences().package_managers == {}
+
     def test_config_immutable(self):
         """Test that Config is immutable."""
         config = Config()
         with pytest.raises(AttributeError):
             config.version = 2  # Should fail (frozen)
 
+    def test_config_has_no_instance_dict(self):
+        """Test Config and its nested preferences use __slots__."""
+        config = Config()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.preferences, "__dict__")
+        assert not hasattr(config.preferences.bulk, "__dict__")
+
 
 class TestConfigMerging:
     """Tests for configuration merging."""
@@ -268,6 +310,24 @@ class TestConfigMerging:
         assert merged.preferences.max_workers == 4  # From config1
         assert merged.preferences.timeout_seconds == 10  # From config2
 
+    def test_merge_preferences_keeps_lower_priority_non_defaults(self):
+        """Test every non-default preference from the lower priority config survives."""
+        from cli_audit.config import BulkPreferences
+
+        config1 = Config(preferences=Preferences(max_workers=4))
+        config2 = Config(preferences=Preferences(
+            auto_upgrade=False,
+            cache_ttl_seconds=600,
+            max_workers=8,
+            bulk=BulkPreferences(fail_fast=True, generate_rollback_script=False),
+        ))
+        merged = config1.merge_with(config2)
+        assert merged.preferences.max_workers == 4  # config1 non-default wins
+        assert merged.preferences.auto_upgrade is False
+        assert merged.preferences.cache_ttl_seconds == 600
+        assert merged.preferences.bulk.fail_fast is True
+        assert merged.preferences.bulk.generate_rollback_script is False
+
     def test_merge_package_managers(self):
         """Test merging package manager hierarchies."""
         prefs1 = Preferences(package_managers={"python": ["uv"]})
@@ -278,6 +338,15 @@ class TestConfigMerging:
         assert "python" in merged.preferences.package_managers
         assert "rust" in merged.preferences.package_managers
 
+    def test_merge_presets_without_mutating_inputs(self):
+        """Test presets merge with this config winning and neither input changed."""
+        config1 = Config(presets={"core": ["rg"]})
+        config2 = Config(presets={"core": ["grep"], "extra": ["fd"]})
+        merged = config1.merge_with(config2)
+        assert merged.presets == {"core": ["rg"], "extra": ["fd"]}
+        assert config1.presets == {"core": ["rg"]}
+        assert config2.presets == {"core": ["grep"], "extra": ["fd"]}
+
     def test_merge_environment_mode_auto(self):
         """Test that 'auto' is replaced by more specific mode."""
         config1 = Config(environment_mode="auto")
@@ -296,10 +365,7 @@ class TestConfigMerging:
 class TestLoadYAML:
     """Tests for YAML loading."""
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_VALID),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_VALID)
     def test_load_yaml_valid(self):
         """Test loading valid YAML file."""
         data = _load_yaml(CONFIG_VALID)
@@ -312,12 +378,34 @@ class TestLoadYAML:
         data = _load_yaml("/nonexistent/file.yml")
         assert data is None
 
-    @pytest.mark.skip(reason="Cannot reliably mock dynamic yaml import")
-    def test_load_yaml_no_pyyaml(self):
+    def test_load_yaml_no_pyyaml(self, tmp_path):
         """Test YAML loading when PyYAML not installed."""
-        # This test is skipped because yaml is imported dynamically inside _load_yaml
-        # and mocking dynamic imports is unreliable due to import caching
-        pass
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("version: 1\n")
+        with patch("cli_audit.config._HAVE_YAML", False):
+            assert _load_yaml(str(yaml_file)) is None
+
+    def test_load_yaml_uses_c_loader_when_available(self):
+        """Test that the libyaml C loader is used when PyYAML was built with it."""
+        yaml = pytest.importorskip("yaml")
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+        with patch("cli_audit.config.yaml.load", wraps=yaml.load) as spy:
+            data = _load_yaml(CONFIG_VALID)
+        assert data["version"] == 1
+        assert spy.call_args.kwargs["Loader"] is yaml.CSafeLoader
+
+    def test_load_yaml_pure_python_fallback(self):
+        """Test that PyYAML without libyaml parses the same data via safe_load."""
+        expected = _load_yaml(CONFIG_VALID)
+        with patch("cli_audit.config._HAVE_LIBYAML", False):
+            assert _load_yaml(CONFIG_VALID) == expected
+
+    def test_load_yaml_rejects_unsafe_tags(self, tmp_path):
+        """Test that the loader keeps safe_load semantics (no arbitrary objects)."""
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("version: !!python/object/apply:os.getcwd []\n")
+        assert _load_yaml(str(yaml_file)) is None
 
 
 class TestLoadJSON:
@@ -338,6 +426,17 @@ class TestLoadJSON:
         data = _load_json(str(json_file))
         assert data is None
 
+    @pytest.mark.parametrize("have_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_load_json_parser_backends(self, tmp_path, have_orjson):
+        """Test that both the orjson and stdlib parsers load the same data."""
+        if have_orjson:
+            pytest.importorskip("orjson")
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"version": 1, "tools": {"rg": {"version": "14.*"}}}', encoding="utf-8")
+        with patch("cli_audit.config._HAVE_ORJSON", have_orjson):
+            data = _load_json(str(json_file))
+        assert data == {"version": 1, "tools": {"rg": {"version": "14.*"}}}
+
     def test_load_json_not_found(self):
         """Test loading non-existent JSON file."""
         data = _load_json("/nonexistent/file.json")
@@ -347,10 +446,7 @@ class TestLoadJSON:
 class TestLoadConfigFile:
     """Tests for loading configuration from file."""
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_VALID),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_VALID)
     def test_load_config_file_valid(self):
         """Test loading valid configuration file."""
         config = load_config_file(CONFIG_VALID)
@@ -358,10 +454,7 @@ class TestLoadConfigFile:
         assert config.version == 1
         assert config.environment_mode == "workstation"
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_MINIMAL),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_MINIMAL)
     def test_load_config_file_minimal(self):
         """Test loading minimal configuration file."""
         config = load_config_file(CONFIG_MINIMAL)
@@ -369,19 +462,13 @@ class TestLoadConfigFile:
         assert config.version == 1
         assert config.environment_mode == "auto"
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_INVALID_VERSION),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_INVALID_VERSION)
     def test_load_config_file_invalid_version(self):
         """Test that invalid version is caught."""
         config = load_config_file(CONFIG_INVALID_VERSION)
         assert config is None  # Validation should fail
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_INVALID_ENV),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_INVALID_ENV)
     def test_load_config_file_invalid_env(self):
         """Test that invalid environment mode is caught."""
         config = load_config_file(CONFIG_INVALID_ENV)
@@ -392,6 +479,51 @@ class TestLoadConfigFile:
         config = load_config_file("/nonexistent/file.yml")
         assert config is None
 
+    def test_load_config_file_memoized_until_file_changes(self, tmp_path):
+        """Test that an unchanged file is parsed once and a rewritten one is reparsed."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("version: 1\nenvironment:\n  mode: ci\n")
+
+        with patch("cli_audit.config._load_yaml", wraps=_load_yaml) as spy:
+            first = load_config_file(str(config_file))
+            second = load_config_file(str(config_file))
+            assert first == second
+            assert spy.call_count == 1
+
+            config_file.write_text("version: 1\nenvironment:\n  mode: server\n")
+            os.utime(config_file, ns=(0, 0))  # Distinct mtime even on coarse-grained filesystems
+            third = load_config_file(str(config_file))
+
+        assert spy.call_count == 2
+        assert first.environment_mode == "ci"
+        assert third.environment_mode == "server"
+        assert list(_loaded_configs) == [(str(config_file), 0, config_file.stat().st_size)]
+
+    def test_load_config_file_returns_independent_copies(self, tmp_path):
+        """Test that mutating one loaded config does not leak into later loads."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("version: 1\npreferences:\n  package_managers:\n    python: [uv]\n")
+
+        config = load_config(custom_path=str(config_file))
+        config.preferences.package_managers["python"].append("pip")
+        config.tools["x"] = None
+
+        reloaded = load_config(custom_path=str(config_file))
+        assert reloaded.preferences.package_managers == {"python": ["uv"]}
+        assert "x" not in reloaded.tools
+
+    def test_load_config_file_does_not_memoize_invalid(self, tmp_path):
+        """Test that a config failing validation is re-read on the next call."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("version: 2\n")
+
+        with patch("cli_audit.config._load_yaml", wraps=_load_yaml) as spy:
+            assert load_config_file(str(config_file)) is None
+            assert load_config_file(str(config_file)) is None
+
+        assert spy.call_count == 2
+        assert not _loaded_configs
+
 
 class TestLoadConfig:
     """Tests for loading and merging configuration from multiple sources."""
@@ -420,10 +552,7 @@ class TestLoadConfig:
         with pytest.raises(ValueError, match="Could not load config"):
             load_config(custom_path="/nonexistent/file.yml")
 
-    @pytest.mark.skipif(
-        not os.path.exists(CONFIG_PROJECT) or not os.path.exists(CONFIG_USER),
-        reason="Test fixtures not found",
-    )
+    @_requires_fixtures(CONFIG_PROJECT, CONFIG_USER)
     def test_load_config_merging(self):
         """Test that multiple config files are merged correctly."""
         # This test would require setting up CONFIG_LOCATIONS to point to fixtures
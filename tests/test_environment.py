@@ -4,17 +4,27 @@ Tests for environment detection (cli_audit/environment.py).
 Target coverage: 90%+
 """
 
-import os
 import pytest
 from unittest.mock import patch, MagicMock
 
+from cli_audit.common import _UTMP_RECORD, _UTMP_RECORD_SIZE, _count_utmp_users, get_active_user_count
 from cli_audit.environment import (
     Environment,
+    _detect_auto,
     detect_environment,
     get_environment_from_config,
+    make_environment,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_detection_cache():
+    """Start every test with an empty auto-detection memo so patched probes take effect."""
+    _detect_auto.cache_clear()
+    yield
+    _detect_auto.cache_clear()
+
+
 class TestEnvironment:
     """Tests for Environment dataclass."""
 
@@ -46,73 +56,81 @@ class TestEnvironment:
             env.mode = "server"  # Should fail (frozen)
 
 
+class TestMakeEnvironment:
+    """Tests for the make_environment factory."""
+
+    def test_make_environment_interns_equal_values(self):
+        """Test equal arguments return the same Environment object."""
+        env = make_environment("workstation", 1.0)
+        assert env is make_environment("workstation", 1.0)
+        assert env == Environment(mode="workstation", confidence=1.0)
+        assert make_environment("server", 1.0) is not env
+
+
 class TestDetectEnvironmentCI:
     """Tests for CI environment detection."""
 
-    @patch.dict(os.environ, {"CI": "true"}, clear=True)
-    def test_detect_ci_with_ci_env(self):
-        """Test CI detection with CI=true."""
+    @pytest.mark.parametrize("var,value", [
+        ("CI", "true"),
+        ("GITHUB_ACTIONS", "true"),
+        ("JENKINS_HOME", "/var/jenkins"),
+        ("TRAVIS", "true"),
+    ])
+    def test_detect_ci_with_env_var(self, clean_env, var, value):
+        """Test CI detection from a single CI variable."""
+        clean_env[var] = value
         env = detect_environment()
         assert env.mode == "ci"
         assert env.confidence >= 0.9
-        assert any("CI" in ind for ind in env.indicators)
+        assert f"env:{var}={value}" in env.indicators
 
-    @patch.dict(os.environ, {"GITHUB_ACTIONS": "true"}, clear=True)
-    def test_detect_ci_with_github_actions(self):
-        """Test CI detection with GITHUB_ACTIONS."""
-        env = detect_environment()
-        assert env.mode == "ci"
-        assert env.confidence >= 0.9
-        assert any("GITHUB_ACTIONS" in ind for ind in env.indicators)
-
-    @patch.dict(os.environ, {"GITLAB_CI": "true", "CI": "true"}, clear=True)
-    def test_detect_ci_with_multiple_indicators(self):
+    def test_detect_ci_with_multiple_indicators(self, clean_env):
         """Test CI detection with multiple indicators."""
+        clean_env.update({"GITLAB_CI": "true", "CI": "true"})
         env = detect_environment()
         assert env.mode == "ci"
         assert env.confidence >= 0.9
         assert len(env.indicators) >= 2
 
-    @patch.dict(os.environ, {"JENKINS_HOME": "/var/jenkins"}, clear=True)
-    def test_detect_ci_with_jenkins(self):
-        """Test CI detection with JENKINS_HOME."""
+    def test_detect_ci_indicators_cover_every_ci_var(self, clean_env):
+        """Test that every CI variable seen by is_ci_environment is reported, in sorted order."""
+        clean_env.update({"TF_BUILD": "True", "GITHUB_ACTIONS": "true", "HOME": "/root"})
         env = detect_environment()
         assert env.mode == "ci"
+        assert env.indicators == ("env:GITHUB_ACTIONS=true", "env:TF_BUILD=True")
 
-    @patch.dict(os.environ, {"TRAVIS": "true"}, clear=True)
-    def test_detect_ci_with_travis(self):
-        """Test CI detection with TRAVIS."""
+    @patch("cli_audit.environment.get_active_user_count", return_value=1)
+    def test_detect_ci_ignores_empty_values(self, mock_users, clean_env):
+        """Test that a CI variable set to an empty string does not mark a CI run."""
+        clean_env["CI"] = ""
         env = detect_environment()
-        assert env.mode == "ci"
+        assert env.mode == "workstation"
 
 
 class TestDetectEnvironmentServer:
     """Tests for server environment detection."""
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=5)
     @patch("cli_audit.environment.get_system_uptime_days", return_value=35)
-    def test_detect_server_with_multiple_users(self, mock_uptime, mock_users):
+    def test_detect_server_with_multiple_users(self, mock_uptime, mock_users, clean_env):
         """Test server detection with multiple active users and uptime."""
         env = detect_environment()
         assert env.mode == "server"
-        assert any("active_users" in ind for ind in env.indicators)
+        assert "active_users=5" in env.indicators
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=4)
     @patch("cli_audit.environment.get_system_uptime_days", return_value=60)
-    def test_detect_server_with_high_uptime(self, mock_uptime, mock_users):
+    def test_detect_server_with_high_uptime(self, mock_uptime, mock_users, clean_env):
         """Test server detection with high uptime and multiple users."""
         env = detect_environment()
         assert env.mode == "server"
-        assert any("uptime_days" in ind for ind in env.indicators)
-        assert any("active_users" in ind for ind in env.indicators)
+        assert "uptime_days=60" in env.indicators
+        assert "active_users=4" in env.indicators
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=2)
     @patch("cli_audit.environment.get_system_uptime_days", return_value=45)
     @patch("os.path.exists")
-    def test_detect_server_with_shared_filesystem(self, mock_exists, mock_uptime, mock_users):
+    def test_detect_server_with_shared_filesystem(self, mock_exists, mock_uptime, mock_users, clean_env):
         """Test server detection with shared filesystem."""
         def exists_side_effect(path):
             return path == "/shared"
@@ -120,31 +138,29 @@ class TestDetectEnvironmentServer:
 
         env = detect_environment()
         assert env.mode == "server"
-        assert any("shared_filesystem" in ind for ind in env.indicators)
+        assert "shared_filesystem" in env.indicators
 
 
 class TestDetectEnvironmentWorkstation:
     """Tests for workstation environment detection (default)."""
 
-    @patch.dict(os.environ, {"DISPLAY": ":0"}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=1)
-    def test_detect_workstation_with_display(self, mock_users):
+    def test_detect_workstation_with_display(self, mock_users, clean_env):
         """Test workstation detection with DISPLAY environment."""
+        clean_env["DISPLAY"] = ":0"
         env = detect_environment()
         assert env.mode == "workstation"
-        assert any("display_environment" in ind for ind in env.indicators)
+        assert "display_environment" in env.indicators
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=1)
-    def test_detect_workstation_single_user(self, mock_users):
+    def test_detect_workstation_single_user(self, mock_users, clean_env):
         """Test workstation detection with single user."""
         env = detect_environment()
         assert env.mode == "workstation"
-        assert any("single_user" in ind for ind in env.indicators)
+        assert "single_user" in env.indicators
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=-1)
-    def test_detect_workstation_default_fallback(self, mock_users):
+    def test_detect_workstation_default_fallback(self, mock_users, clean_env):
         """Test workstation as default fallback."""
         env = detect_environment()
         assert env.mode == "workstation"
@@ -154,94 +170,158 @@ class TestDetectEnvironmentWorkstation:
 class TestDetectEnvironmentOverride:
     """Tests for explicit environment override."""
 
-    def test_override_to_ci(self):
-        """Test explicit override to CI."""
-        env = detect_environment(override="ci")
-        assert env.mode == "ci"
+    @pytest.mark.parametrize("mode", ["ci", "server", "workstation"])
+    def test_override_to_mode(self, mode):
+        """Test explicit override to each environment mode."""
+        env = detect_environment(override=mode)
+        assert env.mode == mode
         assert env.confidence == 1.0
         assert env.override is True
-        assert "explicit_override" in env.indicators[0]
-
-    def test_override_to_server(self):
-        """Test explicit override to server."""
-        env = detect_environment(override="server")
-        assert env.mode == "server"
-        assert env.override is True
+        assert env.indicators == (f"explicit_override={mode}",)
 
-    def test_override_to_workstation(self):
-        """Test explicit override to workstation."""
-        env = detect_environment(override="workstation")
-        assert env.mode == "workstation"
-        assert env.override is True
+    def test_override_returns_shared_instance(self):
+        """Test repeated overrides reuse one interned Environment."""
+        assert detect_environment(override="server") is detect_environment(override="server")
 
     def test_override_invalid_mode(self):
         """Test that invalid override raises ValueError."""
         with pytest.raises(ValueError, match="Invalid environment override"):
             detect_environment(override="invalid")
 
-    def test_override_auto_triggers_detection(self):
+    def test_override_auto_triggers_detection(self, clean_env):
         """Test that override='auto' triggers normal detection."""
-        with patch.dict(os.environ, {"CI": "true"}, clear=True):
-            env = detect_environment(override="auto")
-            assert env.mode == "ci"
-            assert not env.override  # auto means detect, not override
+        clean_env["CI"] = "true"
+        env = detect_environment(override="auto")
+        assert env.mode == "ci"
+        assert not env.override  # auto means detect, not override
+
+
+class TestDetectEnvironmentCache:
+    """Tests for per-process memoization of auto-detection."""
+
+    @patch("cli_audit.environment.get_system_uptime_days", return_value=2)
+    @patch("cli_audit.environment.get_active_user_count", return_value=1)
+    def test_repeated_detection_probes_once(self, mock_users, mock_uptime, clean_env):
+        """Test that an unchanged environment reuses the first detection result."""
+        clean_env["DISPLAY"] = ":0"
+        env = detect_environment()
+        assert detect_environment() is env
+        assert mock_users.call_count == 1
+        assert mock_uptime.call_count == 1
+
+    @patch("cli_audit.environment.get_active_user_count", return_value=1)
+    def test_changed_environment_is_redetected(self, mock_users, clean_env):
+        """Test that changing a detection variable bypasses the memoized result."""
+        assert detect_environment().mode == "workstation"
+        clean_env["CI"] = "true"
+        assert detect_environment().mode == "ci"
+
+    @patch("cli_audit.environment.get_active_user_count", return_value=1)
+    def test_unrelated_variables_do_not_invalidate(self, mock_users, clean_env):
+        """Test that variables detection never reads are left out of the cache key."""
+        clean_env.update({"DISPLAY": ":0", "TERM": "xterm"})
+        env = detect_environment()
+        clean_env["TERM"] = "dumb"
+        assert detect_environment() is env
+
+
+class TestActiveUserCount:
+    """Tests for the utmp-based active user count."""
+
+    @staticmethod
+    def _fake_utmp(path, records):
+        """Write a utmp file: records are (ut_type, pid, line, user) tuples."""
+        with open(path, "wb") as f:
+            for ut_type, pid, line, user in records:
+                record = _UTMP_RECORD.pack(ut_type, pid, line.encode(), b"", user.encode())
+                f.write(record.ljust(_UTMP_RECORD_SIZE, b"\0"))
+        return str(path)
+
+    @staticmethod
+    def _kill(dead_pids):
+        """Fake os.kill(pid, 0) that reports dead_pids as gone."""
+        def kill(pid, sig):
+            if pid in dead_pids:
+                raise ProcessLookupError(pid)
+        return kill
+
+    def test_counts_distinct_logged_in_users(self, tmp_path):
+        """Test that every user session counts once per name, like 'who'."""
+        utmp = self._fake_utmp(tmp_path / "utmp", [
+            (2, 0, "~", "reboot"),  # BOOT_TIME
+            (6, 900, "tty1", "LOGIN"),  # LOGIN_PROCESS (getty)
+            (7, 1000, "pts/0", "alice"),
+            (7, 1001, "pts/1", "alice"),
+            (7, 1002, "tty7", "bob"),  # Graphical session without a pty
+            (7, 1003, "pts/2", "root"),  # Root logins count, as in 'who'
+            (8, 1004, "pts/3", ""),  # DEAD_PROCESS
+        ])
+        with patch("cli_audit.common.os.kill", side_effect=self._kill(set())):
+            assert _count_utmp_users(utmp) == 3
+
+    def test_skips_records_of_exited_sessions(self, tmp_path):
+        """Test that stale USER_PROCESS records are ignored, as 'who' does."""
+        utmp = self._fake_utmp(tmp_path / "utmp", [
+            (7, 1000, "pts/0", "alice"),
+            (7, 1001, "pts/1", "bob"),
+        ])
+        with patch("cli_audit.common.os.kill", side_effect=self._kill({1001})):
+            assert _count_utmp_users(utmp) == 1
+
+    def test_missing_or_foreign_utmp(self, tmp_path):
+        """Test that a missing or non-Linux-layout utmp defers to the 'who' fallback."""
+        assert _count_utmp_users(str(tmp_path / "missing")) is None
+        (tmp_path / "short").write_bytes(b"\0" * 100)
+        assert _count_utmp_users(str(tmp_path / "short")) is None
+
+    def test_get_active_user_count_not_cached(self):
+        """Test that the user count is probed again on every call."""
+        with patch("cli_audit.common._count_utmp_users", side_effect=[3, 4]):
+            assert get_active_user_count() == 3
+            assert get_active_user_count() == 4
 
 
 class TestGetEnvironmentFromConfig:
     """Tests for get_environment_from_config function."""
 
-    def test_config_mode_auto(self):
+    def test_config_mode_auto(self, clean_env):
         """Test that 'auto' triggers detection."""
-        with patch.dict(os.environ, {"GITLAB_CI": "true"}, clear=True):
-            env = get_environment_from_config("auto")
-            assert env.mode == "ci"
-            assert not env.override
-
-    def test_config_mode_none(self):
-        """Test that None triggers detection."""
-        with patch.dict(os.environ, {}, clear=True):
-            env = get_environment_from_config(None)
-            assert env.mode == "workstation"  # Default
-
-    def test_config_mode_explicit_ci(self):
-        """Test explicit CI mode from config."""
-        env = get_environment_from_config("ci")
+        clean_env["GITLAB_CI"] = "true"
+        env = get_environment_from_config("auto")
         assert env.mode == "ci"
-        assert env.override is True
-
-    def test_config_mode_explicit_server(self):
-        """Test explicit server mode from config."""
-        env = get_environment_from_config("server")
-        assert env.mode == "server"
-        assert env.override is True
+        assert not env.override
 
-    def test_config_mode_explicit_workstation(self):
-        """Test explicit workstation mode from config."""
-        env = get_environment_from_config("workstation")
-        assert env.mode == "workstation"
+    def test_config_mode_none(self, clean_env):
+        """Test that None triggers detection."""
+        env = get_environment_from_config(None)
+        assert env.mode == "workstation"  # Default
+
+    @pytest.mark.parametrize("mode", ["ci", "server", "workstation"])
+    def test_config_mode_explicit(self, mode):
+        """Test explicit modes from config are treated as overrides."""
+        env = get_environment_from_config(mode)
+        assert env.mode == mode
         assert env.override is True
 
 
 class TestEnvironmentConfidence:
     """Tests for confidence scoring."""
 
-    @patch.dict(os.environ, {"CI": "true"}, clear=True)
-    def test_ci_high_confidence(self):
+    def test_ci_high_confidence(self, clean_env):
         """Test that CI detection has high confidence."""
+        clean_env["CI"] = "true"
         env = detect_environment()
         assert env.confidence >= 0.9
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=5)
     @patch("cli_audit.environment.get_system_uptime_days", return_value=60)
-    def test_server_medium_confidence(self, mock_uptime, mock_users):
+    def test_server_medium_confidence(self, mock_uptime, mock_users, clean_env):
         """Test that server detection has medium confidence."""
         env = detect_environment()
         assert 0.5 <= env.confidence <= 0.85
 
-    @patch.dict(os.environ, {}, clear=True)
     @patch("cli_audit.environment.get_active_user_count", return_value=1)
-    def test_workstation_medium_confidence(self, mock_users):
+    def test_workstation_medium_confidence(self, mock_users, clean_env):
         """Test that workstation (default) has medium confidence."""
         env = detect_environment()
         assert 0.5 <= env.confidence <= 0.9
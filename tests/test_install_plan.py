@@ -271,6 +271,14 @@ class TestGenerateInstallPlan:
         assert len(plan.steps) >= 2  # At least check and install steps
         assert "rust" in plan.dependencies or "cargo" in plan.dependencies
 
+    def test_generate_plan_reuses_check_step(self):
+        """Test tools on the same package manager share the check step object."""
+        plan1 = generate_install_plan("ripgrep", "ripgrep", "latest", "cargo")
+        plan2 = generate_install_plan("fd", "fd-find", "latest", "cargo")
+        assert plan1.steps[0] is plan2.steps[0]
+        assert plan1.steps[0].command == ("cargo", "--version")
+        assert plan1.steps[1].command != plan2.steps[1].command
+
     def test_generate_plan_npm(self):
         """Test generating plan for npm installation."""
         plan = generate_install_plan(
@@ -0,0 +1,75 @@
+"""
+Tests for the lazily imported public API in cli_audit/__init__.py.
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli_audit
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestLazyExports:
+    """Tests for PEP 562 attribute loading on the cli_audit package."""
+
+    @pytest.mark.parametrize("name", sorted(set(cli_audit.__all__)))
+    def test_public_name_resolves(self, name):
+        """Test every name in __all__ is reachable from the package."""
+        assert getattr(cli_audit, name) is not None
+
+    def test_all_has_no_duplicates(self):
+        """Test __all__ lists each public name once."""
+        assert len(cli_audit.__all__) == len(set(cli_audit.__all__))
+
+    def test_type_checking_imports_match_exports(self):
+        """Test the TYPE_CHECKING imports mirror _EXPORTS name for name."""
+        tree = ast.parse(Path(cli_audit.__file__).read_text())
+        block = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"
+        )
+        imported = {
+            ("." + stmt.module, alias.name)
+            for stmt in block.body if isinstance(stmt, ast.ImportFrom)
+            for alias in stmt.names
+        }
+        exported = {(module, name) for module, names in cli_audit._EXPORTS.items() for name in names}
+        assert imported == exported
+
+    def test_name_matches_defining_module(self):
+        """Test lazily loaded names are the submodule objects themselves."""
+        from cli_audit.bulk import bulk_install
+
+        assert cli_audit.bulk_install is bulk_install
+        assert "bulk_install" in dir(cli_audit)
+
+    def test_submodule_attribute_access(self):
+        """Test submodules stay reachable as package attributes."""
+        assert cli_audit.render.osc8 is cli_audit.osc8
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            cli_audit.no_such_name
+
+    def test_submodule_import_skips_unrelated_modules(self):
+        """Test importing cli_audit.bulk doesn't load collectors/reconcile/upgrade."""
+        code = (
+            "import sys, cli_audit.bulk; "
+            "print(sorted(m for m in ('cli_audit.collectors', 'cli_audit.reconcile', 'cli_audit.upgrade') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
@@ -58,6 +58,12 @@ class TestCompareVersions:
         assert compare_versions("1.0.0", "1.0.0") == 0
         assert compare_versions("2.5.3", "2.5.3") == 0
 
+    def test_compare_versions_numeric_fast_path(self):
+        """Test plain dotted-numeric versions compare numerically, not lexically."""
+        assert compare_versions("1.10.0", "1.9.0") == 1
+        assert compare_versions("1.02.0", "1.2.0") == 0
+        assert compare_versions("1.0", "1.0.0") == 0
+
     def test_compare_versions_major_precedence(self):
         """Test major version takes precedence."""
         assert compare_versions("2.0.0", "1.99.99") == 1
@@ -373,6 +379,114 @@ class TestBackupAndRestore:
         # Cleanup
         cleanup_backup(backup)
 
+    def test_cleanup_backup_removes_directory(self, tmp_path):
+        """Test cleanup removes the backup directory."""
+        binary_path = tmp_path / "test_tool"
+        binary_path.write_text("original content")
+
+        with patch("cli_audit.upgrade.get_config_paths", return_value=[]):
+            backup = create_upgrade_backup("test_tool", str(binary_path), "1.0.0", "cargo")
+
+        cleanup_backup(backup)
+        assert not os.path.exists(backup.backup_path)
+
+
+class TestResultSerialization:
+    """Tests for to_dict() serialization of upgrade results."""
+
+    def test_bulk_upgrade_result_to_dict(self):
+        """Test nested results serialize with all keys and converted sequences."""
+        backup = UpgradeBackup(
+            tool_name="ripgrep",
+            version="13.0.0",
+            binary_path="/usr/bin/rg",
+            backup_path="/tmp/upgrade_backup_ripgrep_x",
+            config_paths=("/home/u/.ripgreprc",),
+            timestamp=1.5,
+            package_manager="cargo",
+            checksum="abc",
+        )
+        upgraded = UpgradeResult(
+            tool_name="ripgrep",
+            success=True,
+            previous_version="13.0.0",
+            new_version="14.0.0",
+            backup=backup,
+            breaking_change=True,
+            breaking_change_accepted=True,
+            duration_seconds=2.0,
+        )
+        failed = UpgradeResult(
+            tool_name="fd",
+            success=False,
+            previous_version="8.0.0",
+            new_version=None,
+            backup=None,
+            rollback_executed=True,
+            rollback_success=True,
+            error_message="boom",
+        )
+        result = BulkUpgradeResult(
+            tools_attempted=("ripgrep", "fd"),
+            upgrades=(upgraded,),
+            skipped=("bat",),
+            failures=(failed,),
+            duration_seconds=3.0,
+            breaking_changes_count=1,
+            rollbacks_executed=1,
+        )
+
+        d = result.to_dict()
+
+        assert d["tools_attempted"] == ["ripgrep", "fd"]
+        assert d["skipped"] == ["bat"]
+        assert d["breaking_changes_count"] == 1
+        assert d["upgrades"][0] == {
+            "tool_name": "ripgrep",
+            "success": True,
+            "previous_version": "13.0.0",
+            "new_version": "14.0.0",
+            "backup": {
+                "tool_name": "ripgrep",
+                "version": "13.0.0",
+                "binary_path": "/usr/bin/rg",
+                "backup_path": "/tmp/upgrade_backup_ripgrep_x",
+                "config_paths": ["/home/u/.ripgreprc"],
+                "timestamp": 1.5,
+                "package_manager": "cargo",
+                "checksum": "abc",
+            },
+            "breaking_change": True,
+            "breaking_change_accepted": True,
+            "rollback_executed": False,
+            "rollback_success": None,
+            "duration_seconds": 2.0,
+            "error_message": None,
+        }
+        assert d["failures"][0]["backup"] is None
+        assert d["failures"][0]["error_message"] == "boom"
+
+    def test_to_dict_key_order(self):
+        """Test serialized key order stays stable for JSON consumers."""
+        backup = UpgradeBackup("rg", "13.0.0", "/usr/bin/rg", "/tmp/b", (), 1.5, "cargo", "abc")
+        upgraded = UpgradeResult("rg", True, "13.0.0", "14.0.0", backup)
+        result = BulkUpgradeResult(("rg",), (upgraded,), (), (), 1.0, 0, 0)
+
+        d = result.to_dict()
+
+        assert list(d) == [
+            "tools_attempted", "upgrades", "skipped", "failures",
+            "duration_seconds", "breaking_changes_count", "rollbacks_executed",
+        ]
+        assert list(d["upgrades"][0]) == [
+            "tool_name", "success", "previous_version", "new_version", "backup", "breaking_change",
+            "breaking_change_accepted", "rollback_executed", "rollback_success", "duration_seconds", "error_message",
+        ]
+        assert list(d["upgrades"][0]["backup"]) == [
+            "tool_name", "version", "binary_path", "backup_path", "config_paths", "timestamp",
+            "package_manager", "checksum",
+        ]
+
 
 class TestUpgradeTool:
     """Tests for single tool upgrade."""
@@ -438,6 +552,24 @@ class TestUpgradeTool:
         assert result.new_version == "14.1.1"
         assert result.backup is not None
 
+    @patch("cli_audit.upgrade.select_package_manager")
+    @patch("cli_audit.upgrade.validate_installation")
+    def test_upgrade_tool_prevalidated_skips_validation(self, mock_validate, mock_select_pm):
+        """Test caller-supplied validation skips validate_installation and PM selection."""
+        config = Config()
+        env = Environment(mode="workstation", confidence=1.0)
+
+        result = upgrade_tool(
+            "ripgrep", "14.1.1", config, env, dry_run=True,
+            _prevalidated=("/usr/bin/rg", "14.1.0", "cargo"),
+        )
+
+        assert result.success is True
+        assert result.previous_version == "14.1.0"
+        assert result.new_version == "14.1.1"
+        mock_validate.assert_not_called()
+        mock_select_pm.assert_not_called()
+
     @patch("cli_audit.upgrade.validate_installation")
     def test_upgrade_tool_not_installed(self, mock_validate):
         """Test upgrade of non-installed tool."""
@@ -605,6 +737,7 @@ class TestGetUpgradeCandidates:
         assert candidates[0].tool_name == "tool1"
         assert candidates[0].current_version == "1.0.0"
         assert candidates[0].available_version == "1.1.0"
+        assert candidates[0].binary_path == "/usr/bin/tool"
 
     @patch("cli_audit.upgrade.check_upgrade_available")
     @patch("cli_audit.upgrade.select_package_manager")
@@ -726,6 +859,92 @@ class TestBulkUpgrade:
         assert len(result.upgrades) == 2
         assert len(result.failures) == 0
 
+    @patch("cli_audit.upgrade.upgrade_tool")
+    @patch("cli_audit.upgrade.get_upgrade_candidates")
+    def test_bulk_upgrade_passes_prevalidated_state(
+        self,
+        mock_get_candidates,
+        mock_upgrade,
+    ):
+        """Test candidates with a known binary path are not re-validated."""
+        mock_get_candidates.return_value = [
+            UpgradeCandidate("tool1", "1.0.0", "1.1.0", False, "cargo", "/usr/bin/tool1"),
+        ]
+        mock_upgrade.return_value = UpgradeResult(
+            tool_name="tool1",
+            success=True,
+            previous_version="1.0.0",
+            new_version="1.1.0",
+            backup=None,
+        )
+
+        config = Config()
+        env = Environment(mode="workstation", confidence=1.0)
+
+        bulk_upgrade("all", config=config, env=env, max_workers=1, interactive=False)
+
+        _, kwargs = mock_upgrade.call_args
+        assert kwargs["_prevalidated"] == ("/usr/bin/tool1", "1.0.0", "cargo")
+
+    @patch("cli_audit.upgrade.vlog")
+    @patch("cli_audit.upgrade.upgrade_tool")
+    @patch("cli_audit.upgrade.get_upgrade_candidates")
+    def test_bulk_upgrade_verbose_logs_each_result(
+        self,
+        mock_get_candidates,
+        mock_upgrade,
+        mock_vlog,
+    ):
+        """Test per-result log lines are all emitted before bulk_upgrade returns."""
+        mock_get_candidates.return_value = [
+            UpgradeCandidate("tool1", "1.0.0", "1.1.0", False, "cargo"),
+            UpgradeCandidate("tool2", "2.0.0", "2.1.0", False, "cargo"),
+        ]
+        mock_upgrade.side_effect = [
+            UpgradeResult(tool_name="tool1", success=True, previous_version="1.0.0", new_version="1.1.0", backup=None),
+            UpgradeResult(tool_name="tool2", success=False, previous_version="2.0.0", new_version=None, backup=None,
+                          error_message="Upgrade failed"),
+        ]
+
+        config = Config()
+        env = Environment(mode="workstation", confidence=1.0)
+
+        bulk_upgrade("all", config=config, env=env, max_workers=1, verbose=True, interactive=False)
+
+        messages = [c.args[0] for c in mock_vlog.call_args_list]
+        assert "✓ tool1: 1.0.0 → 1.1.0" in messages
+        assert "✗ tool2: Upgrade failed" in messages
+
+    @patch("cli_audit.upgrade.upgrade_tool")
+    @patch("cli_audit.upgrade.get_upgrade_candidates")
+    def test_bulk_upgrade_caps_workers_at_candidate_count(
+        self,
+        mock_get_candidates,
+        mock_upgrade,
+    ):
+        """Test the pool is never larger than the number of upgrades."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_get_candidates.return_value = [
+            UpgradeCandidate("tool1", "1.0.0", "1.1.0", False, "cargo"),
+            UpgradeCandidate("tool2", "2.0.0", "2.1.0", False, "cargo"),
+        ]
+        mock_upgrade.return_value = UpgradeResult(
+            tool_name="tool1",
+            success=True,
+            previous_version="1.0.0",
+            new_version="1.1.0",
+            backup=None,
+        )
+
+        config = Config()
+        env = Environment(mode="workstation", confidence=1.0)
+
+        with patch("cli_audit.upgrade.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+            bulk_upgrade("all", config=config, env=env, max_workers=16, interactive=False)
+
+        mock_executor.assert_called_once_with(max_workers=2)
+
     @patch("cli_audit.upgrade.get_upgrade_candidates")
     def test_bulk_upgrade_dry_run(
         self,
@@ -850,21 +1069,28 @@ class TestAptPackageNameResolver:
 class TestCheckUpgradeAvailableAptResolved:
     """Tests for #35: apt-cache policy uses resolved package name."""
 
-    @patch("cli_audit.upgrade.subprocess.run")
-    def test_get_available_version_apt_uses_resolved_name(self, mock_run):
+    @staticmethod
+    def _fake_popen(mock_popen, stdout, returncode=0):
+        """Make the mocked Popen context manager stream stdout line by line."""
+        proc = MagicMock()
+        proc.stdout = iter(stdout.splitlines(keepends=True))
+        proc.poll.return_value = returncode
+        proc.returncode = returncode
+        mock_popen.return_value.__enter__.return_value = proc
+        return proc
+
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_uses_resolved_name(self, mock_popen):
         """get_available_version for apt must use resolve_apt_package_name."""
         clear_version_cache()
 
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="fd-find:\n  Installed: 8.7.0-1\n  Candidate: 9.0.0-1\n",
-        )
+        self._fake_popen(mock_popen, "fd-find:\n  Installed: 8.7.0-1\n  Candidate: 9.0.0-1\n")
 
         version = get_available_version("fd", "apt")
 
         # Verify subprocess was called with the resolved package name
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args[0][0]
         assert call_args == ["apt-cache", "policy", "fd-find"], (
             f"apt-cache policy should use resolved name 'fd-find', got: {call_args}"
         )
@@ -872,19 +1098,16 @@ class TestCheckUpgradeAvailableAptResolved:
 
         clear_version_cache()
 
-    @patch("cli_audit.upgrade.subprocess.run")
-    def test_get_available_version_apt_delta_uses_git_delta(self, mock_run):
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_delta_uses_git_delta(self, mock_popen):
         """get_available_version for delta/apt must use 'git-delta'."""
         clear_version_cache()
 
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="git-delta:\n  Installed: (none)\n  Candidate: 0.16.5-1\n",
-        )
+        self._fake_popen(mock_popen, "git-delta:\n  Installed: (none)\n  Candidate: 0.16.5-1\n")
 
         version = get_available_version("delta", "apt")
 
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert call_args == ["apt-cache", "policy", "git-delta"], (
             f"apt-cache policy should use resolved name 'git-delta', got: {call_args}"
         )
@@ -892,21 +1115,60 @@ class TestCheckUpgradeAvailableAptResolved:
 
         clear_version_cache()
 
-    @patch("cli_audit.upgrade.subprocess.run")
-    def test_get_available_version_apt_ripgrep_unchanged(self, mock_run):
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_ripgrep_unchanged(self, mock_popen):
         """get_available_version for ripgrep/apt should still use 'ripgrep'."""
         clear_version_cache()
 
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="ripgrep:\n  Installed: 14.1.0-1\n  Candidate: 14.1.1-1\n",
-        )
+        self._fake_popen(mock_popen, "ripgrep:\n  Installed: 14.1.0-1\n  Candidate: 14.1.1-1\n")
 
         version = get_available_version("ripgrep", "apt")
 
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert call_args == ["apt-cache", "policy", "ripgrep"], (
             f"apt-cache policy should use 'ripgrep', got: {call_args}"
         )
 
         clear_version_cache()
+
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_stops_at_candidate(self, mock_popen):
+        """apt-cache output after the Candidate line is not consumed."""
+        clear_version_cache()
+
+        proc = self._fake_popen(
+            mock_popen,
+            "ripgrep:\n  Installed: 14.1.0-1\n  Candidate: 14.1.1-1\n  Version table:\n     14.1.1-1 500\n",
+        )
+        proc.poll.return_value = None  # still running when the match is found
+
+        version = get_available_version("ripgrep", "apt")
+
+        assert version == "14.1.1"
+        assert next(proc.stdout) == "  Version table:\n"
+        proc.terminate.assert_called_once()
+
+        clear_version_cache()
+
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_failed_exit_ignored(self, mock_popen):
+        """A Candidate line from an apt-cache run that exits non-zero is not trusted."""
+        clear_version_cache()
+
+        self._fake_popen(mock_popen, "ripgrep:\n  Candidate: 14.1.1-1\n", returncode=100)
+
+        assert get_available_version("ripgrep", "apt") is None
+
+        clear_version_cache()
+
+    @patch("cli_audit.upgrade.subprocess.Popen")
+    def test_get_available_version_apt_timeout_kill_ignored(self, mock_popen):
+        """A run killed by the timeout (negative returncode) yields no version."""
+        clear_version_cache()
+
+        proc = self._fake_popen(mock_popen, "ripgrep:\n  Candidate: 14.1.1-1\n", returncode=-9)
+
+        assert get_available_version("ripgrep", "apt") is None
+        proc.wait.assert_called_once()
+
+        clear_version_cache()
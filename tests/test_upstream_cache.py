@@ -53,6 +53,13 @@ class TestUpstreamVersion:
         assert version.tool_url == "https://github.com/org/repo"
         assert version.upstream_method == "gh"
 
+    def test_upstream_version_has_no_instance_dict(self):
+        """Test UpstreamVersion uses __slots__ (no per-instance __dict__)."""
+        version = UpstreamVersion(latest_version="1.0.0")
+        assert not hasattr(version, "__dict__")
+        with pytest.raises(AttributeError):
+            version.unknown_field = "x"
+
     def test_upstream_version_to_dict(self):
         """Test UpstreamVersion to_dict serialization."""
         version = UpstreamVersion(
@@ -247,6 +254,74 @@ class TestLoadUpstreamCache:
         cache = load_upstream_cache(path)
         assert cache.versions == {}
 
+    @pytest.mark.parametrize("content", [
+        '{"versions": []}',
+        '{"versions": {"fd": "x"}}',
+        '{"__meta__": [], "versions": {}}',
+    ])
+    def test_load_upstream_cache_malformed_shape(self, tmp_path, content):
+        """Test parseable JSON with the wrong shape returns empty cache."""
+        path = tmp_path / "malformed.json"
+        path.write_text(content)
+        cache = load_upstream_cache(path)
+        assert cache == UpstreamCache()
+
+    def test_load_upstream_cache_irregular_entries(self, tmp_path):
+        """Test empty meta, empty entries and unknown keys load like from_dict."""
+        path = tmp_path / "upstream.json"
+        data = {
+            "__meta__": {},
+            "versions": {
+                "fd": {},
+                "bat": {"latest_version": "0.24.0", "extra": "ignored"},
+            },
+        }
+        path.write_text(json.dumps(data))
+
+        cache = load_upstream_cache(path)
+
+        assert cache == UpstreamCache.from_dict(data)
+        assert cache.versions["fd"] == UpstreamVersion()
+        assert cache.versions["bat"].latest_version == "0.24.0"
+
+    def test_load_upstream_cache_reuses_parse_until_file_changes(self, tmp_path):
+        """Test repeated loads of an unchanged file parse it only once."""
+        path = tmp_path / "upstream.json"
+        path.write_text(json.dumps({"versions": {"fd": {"latest_version": "10.0.0"}}}))
+
+        with patch("cli_audit.upstream_cache.json.load", wraps=json.load) as mock_load:
+            first = load_upstream_cache(path)
+            second = load_upstream_cache(path)
+            assert mock_load.call_count == 1
+
+            path.write_text(json.dumps({"versions": {"fd": {"latest_version": "10.1.0"}}}))
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+            third = load_upstream_cache(path)
+            assert mock_load.call_count == 2
+
+        assert first.versions["fd"].latest_version == "10.0.0"
+        assert second.versions["fd"].latest_version == "10.0.0"
+        assert third.versions["fd"].latest_version == "10.1.0"
+
+    def test_load_upstream_cache_returns_independent_versions(self, tmp_path):
+        """Test mutating a loaded cache does not leak into later loads."""
+        path = tmp_path / "upstream.json"
+        path.write_text(json.dumps({"versions": {"fd": {"latest_version": "10.0.0"}}}))
+
+        cache = load_upstream_cache(path)
+        update_cached_upstream("bat", UpstreamVersion(latest_version="0.24.0"), cache)
+
+        assert "bat" not in load_upstream_cache(path).versions
+
+    def test_load_upstream_cache_returns_independent_entries(self, tmp_path):
+        """Test editing a loaded entry in place does not leak into later loads."""
+        path = tmp_path / "upstream.json"
+        path.write_text(json.dumps({"versions": {"fd": {"latest_version": "10.0.0"}}}))
+
+        load_upstream_cache(path).versions["fd"].latest_version = "99.0.0"
+
+        assert load_upstream_cache(path).versions["fd"].latest_version == "10.0.0"
+
 
 class TestWriteUpstreamCache:
     """Tests for write_upstream_cache function."""
@@ -277,6 +352,17 @@ class TestWriteUpstreamCache:
         assert cache.baseline_updated_at != ""
         assert "Z" in cache.baseline_updated_at
 
+    def test_write_upstream_cache_stdlib_fallback_matches_format(self, tmp_path):
+        """Test the json fallback writes indented, sorted, non-escaped UTF-8."""
+        path = tmp_path / "upstream.json"
+        cache = UpstreamCache(versions={"fd": UpstreamVersion(latest_version="10.0.0", latest_tag="v10 ✓")})
+
+        with patch("cli_audit.upstream_cache._HAVE_ORJSON", False):
+            write_upstream_cache(cache, path)
+
+        expected = json.dumps(cache.to_dict(), indent=2, ensure_ascii=False, sort_keys=True)
+        assert path.read_text(encoding="utf-8") == expected
+
     def test_write_upstream_cache_atomic(self, tmp_path):
         """Test atomic write (no .tmp file left behind)."""
         path = tmp_path / "upstream.json"
@@ -366,6 +452,21 @@ class TestIsCacheStale:
         cache = UpstreamCache(baseline_updated_at="not-a-timestamp")
         assert is_cache_stale(cache) is True
 
+    def test_is_cache_stale_naive_timestamp(self):
+        """Test timestamp without timezone is considered stale."""
+        naive = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None).isoformat()
+        cache = UpstreamCache(baseline_updated_at=naive)
+        assert is_cache_stale(cache) is True
+
+    def test_is_cache_stale_follows_timestamp_updates(self):
+        """Test staleness tracks baseline_updated_at after it is reassigned."""
+        old_time = datetime.now(timezone.utc) - timedelta(hours=DEFAULT_MAX_AGE_HOURS + 1)
+        cache = UpstreamCache(baseline_updated_at=old_time.replace(microsecond=0).isoformat())
+        assert is_cache_stale(cache) is True
+
+        cache.baseline_updated_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        assert is_cache_stale(cache) is False
+
 
 class TestMigrateFromSnapshot:
     """Tests for migrate_from_snapshot function."""